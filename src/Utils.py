@@ -47,6 +47,9 @@ class Transliterate:
       }
   }
 
+  # str.translate tables built once from translitDicts
+  translitTables = {name: str.maketrans(chars) for name, chars in translitDicts.items()}
+
   @staticmethod
   def activateTranslit(translit):
     Transliterate.activeTranslit = translit
@@ -59,15 +62,7 @@ class Transliterate:
     if not isinstance(word, str):
       word=str(word)
     
-    converted_word = ''
-    for char in word:
-        transchar = ''
-        if char in Transliterate.translitDicts[Transliterate.activeTranslit]:
-            transchar = Transliterate.translitDicts[Transliterate.activeTranslit][char]
-        else:
-            transchar = char
-        converted_word += transchar
-    return converted_word
+    return word.translate(Transliterate.translitTables[Transliterate.activeTranslit])
 
 class SingletonMeta(type):
     """
@@ -89,31 +84,38 @@ class SingletonMeta(type):
         return cls._instances[cls]
 
 class Sanitizer():
+  # Percent-encoding applied to every id, as a single str.translate table
+  rules = str.maketrans({
+    ' ': '%20',
+    '#': '%23',
+    '&': '%26',
+    '*': '%2A',
+    '.': '%2E',
+    '/': '%2F',
+    '>': '%3E'
+  })
+
   def __init__(self,system="",prefix=""):       
     self.system = system
     self.prefix = prefix if prefix != None else ""
+    self.updateHead()
       
   def setPrefix(self, prefix):
     self.prefix = prefix
+    self.updateHead()
 
   def setSystem(self, system):
     self.system = system
-    
-  def sanitizeId(self, s):
-    rules = {
-      ' ': '%20',
-      '#': '%23',
-      '&': '%26',
-      '*': '%2A',
-      '.': '%2E',
-      '/': '%2F',
-      '>': '%3E'
-    }
+    self.updateHead()
+
+  # "<system>_<prefix>_", already encoded: the rules map single characters, so the head
+  # can be translated once and only the id itself per call
+  def updateHead(self):
     prefix = self.prefix+"_" if self.prefix != "" else ""
     system= self.system+"_" if self.system != "" else ""
+    self.head = (system + prefix).translate(Sanitizer.rules)
     
-    s = '{0}{1}{2}'.format(system,prefix, s)
-    for key in rules:
-        value = rules.get(key)
-        s = s.replace(key, value)
-    return s
\ No newline at end of file
+  def sanitizeId(self, s):
+    if not isinstance(s, str):
+      s = '{0}'.format(s)
+    return self.head + s.translate(Sanitizer.rules)
\ No newline at end of file
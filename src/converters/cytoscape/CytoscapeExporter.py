@@ -1,14 +1,23 @@
+import asyncio
 import json
 import logging
 import os
 from pathlib import Path
-import aiofiles
 import math
 from typing import Dict, List, Any, Optional
 
 from topology import Network, Substation, Bus, Load, Generator, Line, Switch, TwoWindingsTransformer, ThreeWindingsTransformer, DanglingLine, UsagePointLocation, Element
 from base_exporter import Exporter
 
+# The stdlib encoder keeps the output byte-identical to json.dump (orjson formats floats differently)
+_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def iter_json(data: Any):
+    """Yield the indented, UTF-8 encoded JSON of data."""
+    for chunk in _encoder.iterencode(data):
+        yield chunk.encode("utf8")
+
 
 class CytoscapeExporter(Exporter):
     """Cytoscape Exporter for exporting topology to Cytoscape format."""
@@ -34,33 +43,47 @@ class CytoscapeExporter(Exporter):
         layout_type = params.get("layout")
         self.default_network = network.id
         result = {}
+        loop = asyncio.get_running_loop()
+        pending_writes = []
 
-        for sub_topology in [network] + network.getElements("subTopologies"):
-            if len(output_file_elems) > 1:
-                output_file = ".".join(output_file_elems[:-1]) + f"_{sub_topology.id}." + output_file_elems[-1]
-            else:
-                output_file = f"{output_file_elems[0]}_{sub_topology.id}"
+        try:
+            for sub_topology in [network] + network.getElements("subTopologies"):
+                if len(output_file_elems) > 1:
+                    output_file = ".".join(output_file_elems[:-1]) + f"_{sub_topology.id}." + output_file_elems[-1]
+                else:
+                    output_file = f"{output_file_elems[0]}_{sub_topology.id}"
 
-            logger.info(f"Starting Cytoscape CX export to '{output_file}' with {layout_type} layout")
+                logger.info(f"Starting Cytoscape CX export to '{output_file}' with {layout_type} layout")
             
-            # Generate cytoscape elements from network
-            elements = self._generate_cytoscape_elements(sub_topology, system)
+                # Generate cytoscape elements from network
+                elements = self._generate_cytoscape_elements(sub_topology, system)
             
-            # Apply layout to position elements
-            elements = self._apply_layout(elements, layout_type, logger)
+                # Apply layout to position elements
+                elements = self._apply_layout(elements, layout_type, logger)
             
-            # Convert to CX format
-            cx_data = self._convert_to_cx_format(elements, sub_topology, system, include_metadata)
+                # Convert to CX format
+                cx_data = self._convert_to_cx_format(elements, sub_topology, system, include_metadata)
             
-            # Save CX data
-            async with aiofiles.open(output_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(cx_data, indent=2, ensure_ascii=False))
-            
-            logger.info(f"Cytoscape CX file saved to: {output_file}")
+                # Save CX data from a worker thread while the next subtopology is being built
+                pending_writes.append(loop.run_in_executor(None, self._write_json, output_file, cx_data))
 
-            result[sub_topology.id] = Path(output_file)
+                result[sub_topology.id] = Path(output_file)
+        except BaseException:
+            # Let the writes already queued finish (and retrieve their errors) before propagating
+            await asyncio.gather(*pending_writes, return_exceptions=True)
+            raise
+
+        await asyncio.gather(*pending_writes)
+        for output_file in result.values():
+            logger.info(f"Cytoscape CX file saved to: {output_file}")
         return result
 
+    @staticmethod
+    def _write_json(output_file: str, data: Any) -> None:
+        """Stream JSON data to the output file through a large binary write buffer."""
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.writelines(iter_json(data))
+
     def _generate_cytoscape_elements(self, network: Network, system: str) -> Dict[str, Dict]:
         """Generate cytoscape elements from Network topology (direct elements only, not subtopologies)."""
         elements = {}
@@ -112,6 +135,14 @@ class CytoscapeExporter(Exporter):
         else:
             return f"{element_type}@{element_id}"
 
+    def _create_powsybl_id(self, element_id: str, system: str, network_id: str) -> str:
+        """Create the powsybl ID of an element, qualified by the network unless it is the exported one."""
+        if system == "default_system":
+            return element_id
+        if network_id == self.default_network:
+            return f"{system}_{element_id}"
+        return f"{system}_{network_id}_{element_id}"
+
     def _add_substation(self, elements: Dict, substation: Substation, system: str, network_id: str):
         """Add substation to cytoscape elements."""
         substation_id = self._create_prefixed_id("SUBSTATION", substation.id, system)
@@ -122,7 +153,7 @@ class CytoscapeExporter(Exporter):
                 "id": substation_id,
                 "name": substation.name or substation.id,
                 "type": "SUBSTATION",
-                "powsyblId": (f"{system}_{substation.id}" if network_id==self.default_network else f"{system}_{network_id}_{substation.id}" ) if system != "default_system" else substation.id,
+                "powsyblId": self._create_powsybl_id(substation.id, system, network_id),
                 "system": system,
                 "network": network_id,
                 "lat": coords[1] if coords else 0,
@@ -141,7 +172,7 @@ class CytoscapeExporter(Exporter):
                 "id": bus_id,
                 "name": bus.name or bus.id,
                 "type": "BUS",
-                "powsyblId": (f"{system}_{bus.id}" if network_id==self.default_network else f"{system}_{network_id}_{bus.id}" ) if system != "default_system" else bus.id,
+                "powsyblId": self._create_powsybl_id(bus.id, system, network_id),
                 "system": system,
                 "network": network_id,
                 "parent": self._create_prefixed_id("SUBSTATION", substation_id, system) if substation_id else None,
@@ -153,27 +184,32 @@ class CytoscapeExporter(Exporter):
 
     def _add_bus_connected_elements(self, elements: Dict, bus: Bus, system: str, network_id: str, substation_id: Optional[str]):
         """Add all elements connected to a bus."""
-        bus_id = self._create_prefixed_id("BUS", bus.id, system)
-        parent = self._create_prefixed_id("SUBSTATION", substation_id, system) if substation_id else None
+        # Bound once: the loops below run for every element attached to the bus
+        create_id = self._create_prefixed_id
+        create_powsybl_id = self._create_powsybl_id
+        get_coordinates = self._get_coordinates
+        bus_id = create_id("BUS", bus.id, system)
+        parent = create_id("SUBSTATION", substation_id, system) if substation_id else None
         
         # Add loads
         for load in bus.getElements("loads"):
-            load_id = self._create_prefixed_id("LOAD", load.id, system)
-            line_id = self._create_prefixed_id("LOAD_LINE", load.id, system)
-            coords = self._get_coordinates(load)
+            load_id = create_id("LOAD", load.id, system)
+            line_id = create_id("LOAD_LINE", load.id, system)
+            coords = get_coordinates(load)
+            lat, lon = (coords[1], coords[0]) if coords else (0, 0)
             
             elements[load_id] = {
                 "data": {
                     "id": load_id,
                     "name": load.name or load.id,
                     "type": "LOAD",
-                    "powsyblId": (f"{system}_{load.id}" if network_id==self.default_network else f"{system}_{network_id}_{load.id}" ) if system != "default_system" else load.id,
+                    "powsyblId": create_powsybl_id(load.id, system, network_id),
                     "system": system,
                     "network": network_id,
                     "parent": parent,
                     "ratedPower": getattr(load, 'p', 0),
-                    "lat": coords[1] if coords else 0,
-                    "lon": coords[0] if coords else 0
+                    "lat": lat,
+                    "lon": lon
                 }
             }
             
@@ -188,22 +224,23 @@ class CytoscapeExporter(Exporter):
         
         # Add generators
         for generator in bus.getElements("generators"):
-            generator_id = self._create_prefixed_id("GENERATOR", generator.id, system)
-            line_id = self._create_prefixed_id("GENERATOR_LINE", generator.id, system)
-            coords = self._get_coordinates(generator)
+            generator_id = create_id("GENERATOR", generator.id, system)
+            line_id = create_id("GENERATOR_LINE", generator.id, system)
+            coords = get_coordinates(generator)
+            lat, lon = (coords[1], coords[0]) if coords else (0, 0)
             
             elements[generator_id] = {
                 "data": {
                     "id": generator_id,
                     "name": generator.name or generator.id,
                     "type": "GENERATOR",
-                    "powsyblId": (f"{system}_{generator.id}" if network_id==self.default_network else f"{system}_{network_id}_{generator.id}" ) if system != "default_system" else  generator.id,
+                    "powsyblId": create_powsybl_id(generator.id, system, network_id),
                     "system": system,
                     "network": network_id,
                     "parent": parent,
                     "maxPower": getattr(generator, 'maxP', 0),
-                    "lat": coords[1] if coords else 0,
-                    "lon": coords[0] if coords else 0
+                    "lat": lat,
+                    "lon": lon
                 }
             }
             
@@ -218,21 +255,22 @@ class CytoscapeExporter(Exporter):
         
         # Add dangling lines
         for dangling_line in bus.getElements("danglingLines"):
-            dangling_line_id = self._create_prefixed_id("DANGLINGLINE", dangling_line.id, system)
-            line_id = self._create_prefixed_id("DANGLINGLINE_LINE", dangling_line.id, system)
-            coords = self._get_coordinates(dangling_line)
+            dangling_line_id = create_id("DANGLINGLINE", dangling_line.id, system)
+            line_id = create_id("DANGLINGLINE_LINE", dangling_line.id, system)
+            coords = get_coordinates(dangling_line)
+            lat, lon = (coords[1], coords[0]) if coords else (0, 0)
             
             elements[dangling_line_id] = {
                 "data": {
                     "id": dangling_line_id,
                     "name": dangling_line.name or dangling_line.id,
                     "type": "DANGLINGLINE",
-                    "powsyblId": (f"{system}_{dangling_line.id}" if network_id==self.default_network else f"{system}_{network_id}_{dangling_line.id}" ) if system != "default_system" else  dangling_line.id,
+                    "powsyblId": create_powsybl_id(dangling_line.id, system, network_id),
                     "system": system,
                     "network": network_id,
                     "parent": parent,
-                    "lat": coords[1] if coords else 0,
-                    "lon": coords[0] if coords else 0
+                    "lat": lat,
+                    "lon": lon
                 }
             }
             
@@ -247,21 +285,22 @@ class CytoscapeExporter(Exporter):
         
         # Add usage point locations
         for upl in bus.getElements("usagePointLocations"):
-            upl_id = self._create_prefixed_id("USAGE_POINT_LOCATION", upl.id, system)
-            line_id = self._create_prefixed_id("USAGE_POINT_LOCATION_LINE", upl.id, system)
-            coords = self._get_coordinates(upl)
+            upl_id = create_id("USAGE_POINT_LOCATION", upl.id, system)
+            line_id = create_id("USAGE_POINT_LOCATION_LINE", upl.id, system)
+            coords = get_coordinates(upl)
+            lat, lon = (coords[1], coords[0]) if coords else (0, 0)
             
             elements[upl_id] = {
                 "data": {
                     "id": upl_id,
                     "name": upl.name or upl.id,
                     "type": "USAGE_POINT_LOCATION",
-                    "powsyblId": (f"{system}_{upl.id}" if network_id==self.default_network else f"{system}_{network_id}_{upl.id}" ) if system != "default_system" else  upl.id,
+                    "powsyblId": create_powsybl_id(upl.id, system, network_id),
                     "system": system,
                     "network": network_id,
                     "parent": parent,
-                    "lat": coords[1] if coords else 0,
-                    "lon": coords[0] if coords else 0
+                    "lat": lat,
+                    "lon": lon
                 }
             }
             
@@ -286,7 +325,7 @@ class CytoscapeExporter(Exporter):
                 "id": transformer_id,
                 "name": transformer.name or transformer.id,
                 "type": "2WINDINGSTRANSFORMER",
-                "powsyblId": (f"{system}_{transformer.id}" if network_id==self.default_network else f"{system}_{network_id}_{transformer.id}" ) if system != "default_system" else  transformer.id,
+                "powsyblId": self._create_powsybl_id(transformer.id, system, network_id),
                 "system": system,
                 "network": network_id,
                 "parent": self._create_prefixed_id("SUBSTATION", substation_id, system),
@@ -327,7 +366,7 @@ class CytoscapeExporter(Exporter):
                 "id": transformer_id,
                 "name": transformer.name or transformer.id,
                 "type": "3WINDINGSTRANSFORMER",
-                "powsyblId": (f"{system}_{transformer.id}" if network_id==self.default_network else f"{system}_{network_id}_{transformer.id }" ) if system != "default_system" else  transformer.id,
+                "powsyblId": self._create_powsybl_id(transformer.id, system, network_id),
                 "system": system,
                 "network": network_id,
                 "parent": self._create_prefixed_id("SUBSTATION", substation_id, system),
@@ -375,7 +414,7 @@ class CytoscapeExporter(Exporter):
                 "id": switch_id,
                 "name": switch.name or switch.id,
                 "type": "SWITCH",
-                "powsyblId": (f"{system}_{switch.id}" if network_id==self.default_network else f"{system}_{network_id}_{switch.id}" ) if system != "default_system" else switch.id,
+                "powsyblId": self._create_powsybl_id(switch.id, system, network_id),
                 "system": system,
                 "network": network_id,
                 "parent": self._create_prefixed_id("SUBSTATION", substation_id, system) if substation_id else None,
@@ -454,51 +493,23 @@ class CytoscapeExporter(Exporter):
         # Separate nodes and edges
         nodes = []
         edges = []
+        edge_attributes = []
         node_id_map = {}  # Map from string IDs to numeric IDs
         current_node_id = 0
         current_edge_id = 0
         
-        # Process nodes first
+        node_attributes = []
+        
+        # Process nodes first, with their attributes in the same pass
         for element_id, element in elements.items():
-            if "source" not in element["data"]:  # This is a node
-                node_id_map[element["data"]["id"]] = current_node_id
+            data = element["data"]
+            if "source" not in data:  # This is a node
+                node_id_map[data["id"]] = current_node_id
                 nodes.append({
                     "@id": current_node_id,
-                    "n": element["data"]["name"],
-                    "r": element["data"]["id"]  # Use 'r' for represents (original ID)
+                    "n": data["name"],
+                    "r": data["id"]  # Use 'r' for represents (original ID)
                 })
-                current_node_id += 1
-        
-        # Process edges
-        for element_id, element in elements.items():
-            if "source" in element["data"]:  # This is an edge
-                source_id = node_id_map.get(element["data"]["source"])
-                target_id = node_id_map.get(element["data"]["target"])
-                
-                if source_id is not None and target_id is not None:
-                    edges.append({
-                        "@id": current_edge_id,
-                        "s": source_id,
-                        "t": target_id,
-                        "i": element["data"].get("type", "unknown")
-                    })
-                    current_edge_id += 1
-        
-        # Add nodes to CX
-        if nodes:
-            cx_data.append({"nodes": nodes})
-        
-        # Add edges to CX
-        if edges:
-            cx_data.append({"edges": edges})
-        
-        # Node attributes
-        node_attributes = []
-        
-        for element_id, element in elements.items():
-            if "source" not in element["data"]:  # This is a node
-                node_numeric_id = node_id_map[element["data"]["id"]]
-                data = element["data"]
                 
                 # Add various node attributes
                 attributes_to_add = [
@@ -515,18 +526,14 @@ class CytoscapeExporter(Exporter):
                 for attr_name, attr_value in attributes_to_add:
                     if attr_value is not None:
                         node_attributes.append({
-                            "po": node_numeric_id,
+                            "po": current_node_id,
                             "n": attr_name,
                             "v": attr_value
                         })
+                
+                current_node_id += 1
         
-        if node_attributes:
-            cx_data.append({"nodeAttributes": node_attributes})
-        
-        # Edge attributes
-        edge_attributes = []
-        edge_idx = 0
-        
+        # Process edges, resolving both endpoints once for the edge and its attributes
         for element_id, element in elements.items():
             if "source" in element["data"]:  # This is an edge
                 source_id = node_id_map.get(element["data"]["source"])
@@ -534,7 +541,13 @@ class CytoscapeExporter(Exporter):
                 
                 if source_id is not None and target_id is not None:
                     data = element["data"]
-                    
+                    edges.append({
+                        "@id": current_edge_id,
+                        "s": source_id,
+                        "t": target_id,
+                        "i": data.get("type", "unknown")
+                    })
+
                     # Add edge attributes
                     attributes_to_add = [
                         ("interaction", data.get("type", "unknown")),
@@ -545,13 +558,26 @@ class CytoscapeExporter(Exporter):
                     for attr_name, attr_value in attributes_to_add:
                         if attr_value is not None:
                             edge_attributes.append({
-                                "po": edge_idx,
+                                "po": current_edge_id,
                                 "n": attr_name,
                                 "v": attr_value
                             })
-                    
-                    edge_idx += 1
+
+                    current_edge_id += 1
+        
+        # Add nodes to CX
+        if nodes:
+            cx_data.append({"nodes": nodes})
         
+        # Add edges to CX
+        if edges:
+            cx_data.append({"edges": edges})
+        
+        # Node attributes
+        if node_attributes:
+            cx_data.append({"nodeAttributes": node_attributes})
+        
+        # Edge attributes
         if edge_attributes:
             cx_data.append({"edgeAttributes": edge_attributes})
 
@@ -1,8 +1,7 @@
-import json
+import asyncio
 import logging
 import os
 from pathlib import Path
-import aiofiles
 from typing import Dict, List, Any, Optional
 from .CytoscapeExporter import CytoscapeExporter
 from topology import Network, Substation, Bus, Load, Generator, Line, Switch, TwoWindingsTransformer, ThreeWindingsTransformer, DanglingLine, UsagePointLocation, Element
@@ -32,31 +31,39 @@ class CytoscapeJsExporter(CytoscapeExporter):
         layout_type = params.get("layout")
         self.default_network = network.id
         result = {}
+        loop = asyncio.get_running_loop()
+        pending_writes = []
 
-        for sub_topology in [network] + network.getElements("subTopologies"):
-            if len(output_file_elems) > 1:
-                output_file = ".".join(output_file_elems[:-1]) + f"_{sub_topology.id}." + output_file_elems[-1]
-            else:
-                output_file = f"{output_file_elems[0]}_{sub_topology.id}"
+        try:
+            for sub_topology in [network] + network.getElements("subTopologies"):
+                if len(output_file_elems) > 1:
+                    output_file = ".".join(output_file_elems[:-1]) + f"_{sub_topology.id}." + output_file_elems[-1]
+                else:
+                    output_file = f"{output_file_elems[0]}_{sub_topology.id}"
 
-            logger.info(f"Starting Cytoscape JS export to '{output_file}' with {layout_type} layout")
+                logger.info(f"Starting Cytoscape JS export to '{output_file}' with {layout_type} layout")
             
-            # Generate cytoscape elements from network
-            elements = self._generate_cytoscape_elements(sub_topology, system)
+                # Generate cytoscape elements from network
+                elements = self._generate_cytoscape_elements(sub_topology, system)
             
-            # Apply layout to position elements
-            elements = self._apply_layout(elements, layout_type, logger)
+                # Apply layout to position elements
+                elements = self._apply_layout(elements, layout_type, logger)
             
-            # Convert to JS format
-            js_data = self._convert_to_js_format(elements, sub_topology, system, include_metadata)
+                # Convert to JS format
+                js_data = self._convert_to_js_format(elements, sub_topology, system, include_metadata)
 
-            # Save JS data
-            async with aiofiles.open(output_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(js_data, indent=2, ensure_ascii=False))
+                # Save JS data from a worker thread while the next subtopology is being built
+                pending_writes.append(loop.run_in_executor(None, self._write_json, output_file, js_data))
 
-            logger.info(f"Cytoscape JS file saved to: {output_file}")
+                result[sub_topology.id] = Path(output_file)
+        except BaseException:
+            # Let the writes already queued finish (and retrieve their errors) before propagating
+            await asyncio.gather(*pending_writes, return_exceptions=True)
+            raise
 
-            result[sub_topology.id] = Path(output_file)
+        await asyncio.gather(*pending_writes)
+        for output_file in result.values():
+            logger.info(f"Cytoscape JS file saved to: {output_file}")
         return result
 
     def _convert_to_js_format(self, elements: Dict[str, Dict], network: Network, system: str, include_metadata: bool) -> Any:
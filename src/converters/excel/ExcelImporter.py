@@ -1,5 +1,6 @@
 import math
 import logging
+import sys
 from os import system
 
 import warnings
@@ -75,10 +76,12 @@ class ExcelImporter(Importer):
             Network object containing the imported topology
         """
         logger.info("> Starting excel processing '{}'".format(str(input_file)))
-        network = self._process_common(input_file, network_id, system, logger)
-        self._process_mv_topology(network, input_file, logger)
-        if process_lv:
-            network:Network = self._process_lv_topology(network, input_file, lv_network_id=lv_network_id, logger=logger)
+        # Open the workbook once; every sheet is then parsed from the same file handle
+        with pd.ExcelFile(input_file) as workbook:
+            network = self._process_common(workbook, network_id, system, logger)
+            self._process_mv_topology(network, workbook, logger)
+            if process_lv:
+                network:Network = self._process_lv_topology(network, workbook, lv_network_id=lv_network_id, logger=logger)
         logger.info("Finished excel processing!")
         return network
 
@@ -87,7 +90,7 @@ class ExcelImporter(Importer):
         Process common network elements (NETWORKS, SUBSTATIONS, BUSES sheets).
         
         Args:
-            input_file: Path to the Excel file
+            input_file: Path to the Excel file or an opened pd.ExcelFile
             logger: Logger instance for logging messages
             
         Returns:
@@ -95,8 +98,8 @@ class ExcelImporter(Importer):
         """
         network:Network = None
         # assume fields ["ID","NAME","TYPE"]
-        df = pd.read_excel(input_file, sheet_name='NETWORKS')
-        for index, row in df.iterrows():
+        networks_df = pd.read_excel(input_file, sheet_name='NETWORKS')
+        for index, row in networks_df.iterrows():
             if str(row['EXTERNAL'])=='0' and network_id is None or row['ID']==network_id:
                 network = Network(row['ID'],name=row['NAME'], network=row['ID'], system=system)
                 break # process first internal network
@@ -121,16 +124,16 @@ class ExcelImporter(Importer):
             substation:Substation = network.getSubstation(row['SUBSTATION'])
             if substation is None:
                 continue
-            voltageLevel:VoltageLevel= network.getVoltageLevel("VL"+str(row['U']))
+            vl_id = "VL"+str(row['U'])
+            voltageLevel:VoltageLevel= network.getVoltageLevel(vl_id)
             if voltageLevel is None:
-                voltageLevel = network.addVoltageLevel("VL"+str(row['U']),"VL"+str(row['U']), nominalV= row['U'], type="MV")
+                voltageLevel = network.addVoltageLevel(vl_id,vl_id, nominalV= row['U'], type="MV")
             coords=[]
             if not math.isnan(row.get('LATITUDE', math.nan)) and not math.isnan(row.get('LONGITUDE', math.nan)):
                 coords = [row.get('LATITUDE',math.nan), row.get('LONGITUDE',math.nan)]
             substation.addBus(row['ID'], row['NAME'],voltageLevel=voltageLevel, coords=coords)
 
-        df = pd.read_excel(input_file, sheet_name='NETWORKS')
-        for index, row in df.iterrows():
+        for index, row in networks_df.iterrows():
             if str(row['EXTERNAL'])=='1':
                 bus:Bus = network.getBus(row['BUS'])
                 if bus is not None:
@@ -138,6 +141,55 @@ class ExcelImporter(Importer):
                     
         return network
 
+    @staticmethod
+    def _feeder_num(row) -> str:
+        """
+        Return the FEEDER_NUM of a row as a string, or None when it is missing.
+        The values are interned, as the same few numbers are stored on every
+        element of a feeder.
+        """
+        if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]):
+            return sys.intern(str(int(row["FEEDER_NUM"])))
+        return None
+
+    @staticmethod
+    def _cell_id(value) -> str:
+        """
+        Return a cell read as a number (e.g. 1234.0) as the id string used in
+        the topology. Rows call this once per referenced column and reuse the
+        result instead of formatting the same float again for every lookup.
+        """
+        return str(value).replace(".0","")
+
+    @staticmethod
+    def _line_shape(values, start: int) -> list:
+        """
+        Read the line geometry of a row: the (lat, lon) pairs stored from
+        column `start` on, up to the first empty cell. Points are kept as
+        tuples, the smallest container for a coordinate pair.
+        """
+        line_shape = []
+        index = start
+        while index < len(values):
+            if math.isnan(values[index]):
+                break
+            line_shape.append((values[index], values[index+1]))
+            index += 2
+        return line_shape
+
+    @staticmethod
+    def _find_sub_topology_bus(network: Network, id: str) -> Bus:
+        """
+        Return the bus with the given id from the first sub topology of the
+        network that has it, or None. Stops at the first match, each sub
+        topology answering from its own bus registry.
+        """
+        for sub_topology in network.getElements("subTopologies"):
+            bus = sub_topology.getBus(id)
+            if bus is not None:
+                return bus
+        return None
+
     def _process_mv_topology(self, mv_network: Network, input_file: str, logger: logging.Logger) -> None:
         """
         Process Medium Voltage (MV) topology elements.
@@ -147,7 +199,7 @@ class ExcelImporter(Importer):
         
         Args:
             MVNetwork: Network object to populate with MV elements
-            filename: Path to the Excel file
+            filename: Path to the Excel file or an opened pd.ExcelFile
             logger: Logger instance for logging messages
         """
         # assume fields ["ID", "NAME", "BUS1", "BUS2","R","X","G","B","NOMINALPOWER",
@@ -225,6 +277,7 @@ class ExcelImporter(Importer):
             mv_network.addSwitch(row["ID"], row['NAME'], bus1, bus2, row['OPEN'], coords=coords)
 
         df = pd.read_excel(input_file, sheet_name='LINES')
+        coords_index = df.columns.get_loc('COORDS')
         for index, row in df.iterrows():
             bus1:Bus = mv_network.getBus(row["BUS1"])
             bus2:Bus = mv_network.getBus(row["BUS2"])
@@ -235,13 +288,7 @@ class ExcelImporter(Importer):
                 #print(f"Bus2 not found: {row["BUS2"]}")
                 continue
             
-            line_shape=[]
-            index=list(row.keys()).index('COORDS')
-            while index<len(row.values):
-                if math.isnan(row.values[index]):
-                    break
-                line_shape.append([row.values[index],row.values[index+1]])
-                index+=2                    
+            line_shape = self._line_shape(row.values, coords_index)
             mv_network.addLine(row["ID"],row['NAME'],bus1=bus1,bus2=bus2,r=row['R'],x=row['X'],g1=row['G1'],b1=row['B1'],g2=row["G2"],b2=row["B2"],currentLimit=row['CURRENTLIMIT'],cable=row['WIREINFO'], length=row['LENGTH'],line_shape=line_shape) 
 
     def _process_lv_topology(self, mv_network: Network, filename: str, lv_network_id: str, logger: logging.Logger) -> Network:
@@ -253,11 +300,12 @@ class ExcelImporter(Importer):
         
         Args:
             MVNetwork: Network object containing MV network and LV subtopologies
-            filename: Path to the Excel file
+            filename: Path to the Excel file or an opened pd.ExcelFile
             logger: Logger instance for logging messages
         """
         # assume fields ["ID","NAME","FEEDER","FEEDER_NUM","LENGTH", "WIREINFO","NODE1","NODE2","R","X","G1","B1","G2","B2","CURRENTLIMIT","COORDS"]
         df = pd.read_excel(filename, sheet_name='LINESEGMENTS')
+        coords_index = df.columns.get_loc('COORDS')
         actual_network: Network = mv_network
         for index, row in df.iterrows():
             if lv_network_id is not None and row['FEEDER'] != lv_network_id:
@@ -269,7 +317,7 @@ class ExcelImporter(Importer):
                 if lv_network_id is not None:
                     actual_network = lv_network
 
-            feeder_num = (str(int(row["FEEDER_NUM"])) if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]) else None)
+            feeder_num = self._feeder_num(row)
 
             # This replicates the MV part in the LV part
             mv_bus: Bus = mv_network.getBus(row['FEEDER'])
@@ -309,13 +357,7 @@ class ExcelImporter(Importer):
             if bus2 is None:
                 bus2 = lv_network.addBus(row['NODE2'], row['NODE2'],voltageLevel=voltageLevel, feeder_num=feeder_num)
             
-            line_shape=[]
-            index=list(row.keys()).index('COORDS')
-            while index<len(row.values):
-                if math.isnan(row.values[index]):
-                    break
-                line_shape.append([row.values[index],row.values[index+1]])
-                index+=2                    
+            line_shape = self._line_shape(row.values, coords_index)
             
             lv_network.addLine(row['ID'], row['NAME'], bus1=bus1, bus2= bus2, length=row['LENGTH'], r=row['R'], x=row['X'], b1=row['B1'], g1=row['G1'],b2=row['B2'], g2=row['G2'], currentLimit=row['CURRENTLIMIT'],cable=row['WIREINFO'], line_shape=line_shape, feeder_num=feeder_num)
 
@@ -327,27 +369,28 @@ class ExcelImporter(Importer):
 
             lv_network:Network = mv_network.getSubTopology(row['FEEDER'])
             if lv_network:
-                bus1:Bus = lv_network.getBus(str(row["BUS1"]).replace(".0",""))
-                bus2:Bus = lv_network.getBus(str(row["BUS2"]).replace(".0",""))
-                feeder_num = (str(int(row["FEEDER_NUM"])) if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]) else None)
+                bus1_id = self._cell_id(row["BUS1"])
+                bus2_id = self._cell_id(row["BUS2"])
+                bus1:Bus = lv_network.getBus(bus1_id)
+                bus2:Bus = lv_network.getBus(bus2_id)
+                feeder_num = self._feeder_num(row)
                 if bus1 is None and bus2 is None:
                     # print(f"Bus1 and Bus2 not found: {row["BUS1"]} {row["BUS2"]}")
                     # continue
                     feeder_bus: Bus = lv_network.getBus(row['FEEDER'])
-                    bus1 = lv_network.addBus(str(row["BUS1"]).replace(".0",""), str(row["BUS1"]).replace(".0",""), voltageLevel=feeder_bus.voltageLevel,feeder_num=feeder_num)
-                    bus2 = lv_network.addBus(str(row["BUS2"]).replace(".0",""), str(row["BUS2"]).replace(".0",""), voltageLevel=feeder_bus.voltageLevel,feeder_num=feeder_num)
+                    bus1 = lv_network.addBus(bus1_id, bus1_id, voltageLevel=feeder_bus.voltageLevel,feeder_num=feeder_num)
+                    bus2 = lv_network.addBus(bus2_id, bus2_id, voltageLevel=feeder_bus.voltageLevel,feeder_num=feeder_num)
                     lv_network.addSwitch(row["ID"], row['NAME'], bus1, bus2, row['NORMALLYOPEN'], coords=(row['LATITUDE'], row['LONGITUDE']) if 'LATITUDE' in row and 'LONGITUDE' in row else None , feeder_num=feeder_num)
                 elif bus1 is None:
-                    find_buses = [e for e in [e.getBus(str(row["BUS1"]).replace(".0","")) for e in mv_network.getElements("subTopologies")] if e is not None]
-                    bus1 = find_buses[0] if len(find_buses) > 0 else None
+                    bus1 = self._find_sub_topology_bus(mv_network, bus1_id)
                     dl_type = "LV"
                     if bus1 is None:
                         # if not present in a subtopology, check in the MV network
-                        bus1 = mv_network.getBus(str(row["BUS1"]).replace(".0",""))
+                        bus1 = mv_network.getBus(bus1_id)
                         dl_type = "MV"
                         if bus1 is None:
                             # if not found, add to current network and continue
-                            bus1 = lv_network.addBus(str(row["BUS1"]).replace(".0",""), str(row["BUS1"]).replace(".0",""), voltageLevel=bus2.voltageLevel,feeder_num=feeder_num)
+                            bus1 = lv_network.addBus(bus1_id, bus1_id, voltageLevel=bus2.voltageLevel,feeder_num=feeder_num)
                             lv_network.addSwitch(row["ID"], row['NAME'], bus1, bus2, row['NORMALLYOPEN'], coords=(row['LATITUDE'], row['LONGITUDE']), feeder_num=feeder_num)
                             continue
                     # buses in different networks, add dangling line to bus in other network
@@ -356,21 +399,20 @@ class ExcelImporter(Importer):
                     other_network = bus1.parent
                     bus2.addDanglingLine(other_network.id + "_" + bus1.name, other_network.name, type=dl_type)
                     # add fictitious bus to current network
-                    new_bus_name = str(row["BUS2"]).replace(".0","") + "_" + str(row["BUS1"]).replace(".0","")
+                    new_bus_name = bus2_id + "_" + bus1_id
                     new_bus = lv_network.addBus(new_bus_name, new_bus_name, voltageLevel=bus2.voltageLevel,feeder_num=feeder_num)
                     # add switch to current network with fictitious bus
                     lv_network.addSwitch(row["ID"], row['NAME'], new_bus, bus2, row['NORMALLYOPEN'], coords=(row['LATITUDE'], row['LONGITUDE']), feeder_num=feeder_num)
                 elif bus2 is None:
-                    find_buses = [e for e in [e.getBus(str(row["BUS2"]).replace(".0","")) for e in mv_network.getElements("subTopologies")] if e is not None]
-                    bus2 = find_buses[0] if len(find_buses) > 0 else None
+                    bus2 = self._find_sub_topology_bus(mv_network, bus2_id)
                     dl_type = "LV"
                     if bus2 is None:
                         # if not present in a subtopology, check in the MV network
-                        bus2 = mv_network.getBus(str(row["BUS2"]).replace(".0",""))
+                        bus2 = mv_network.getBus(bus2_id)
                         dl_type = "MV"
                         if bus2 is None:
                             # if not found, add to current network and continue
-                            bus2 = lv_network.addBus(str(row["BUS2"]).replace(".0",""), str(row["BUS2"]).replace(".0",""), voltageLevel=bus1.voltageLevel,feeder_num=feeder_num)
+                            bus2 = lv_network.addBus(bus2_id, bus2_id, voltageLevel=bus1.voltageLevel,feeder_num=feeder_num)
                             lv_network.addSwitch(row["ID"], row['NAME'], bus1, bus2, row['NORMALLYOPEN'], coords=(row['LATITUDE'], row['LONGITUDE']) if 'LATITUDE' in row and 'LONGITUDE' in row else None, feeder_num=feeder_num)
                             continue
                     # buses in different networks, add dangling line to bus in other network
@@ -379,7 +421,7 @@ class ExcelImporter(Importer):
                     other_network = bus2.parent
                     bus1.addDanglingLine(other_network.id + "_" + bus2.name, other_network.name, type=dl_type)
                     # add fictitious bus to current network
-                    new_bus_name = str(row["BUS1"]).replace(".0","") + "_" + str(row["BUS2"]).replace(".0","")
+                    new_bus_name = bus1_id + "_" + bus2_id
                     new_bus = lv_network.addBus(new_bus_name, new_bus_name, voltageLevel=bus1.voltageLevel,feeder_num=feeder_num)
                     # add switch to current network with fictitious bus
                     lv_network.addSwitch(row["ID"], row['NAME'], bus1, new_bus, row['NORMALLYOPEN'], coords=(row['LATITUDE'], row['LONGITUDE']), feeder_num=feeder_num)
@@ -399,7 +441,7 @@ class ExcelImporter(Importer):
             if bus is None:
                 logger.error("NODE '{}' not found in LINESEGMENTS".format(row['ID']))
                 continue
-            feeder_num = (str(int(row["FEEDER_NUM"])) if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]) else None)
+            feeder_num = self._feeder_num(row)
             bus.addUsagePointLocation(row['ID'], row['NAME'], [row['LATITUDE'], row['LONGITUDE']] if 'LATITUDE' in row and 'LONGITUDE' in row else None, feeder_num=feeder_num)
 
         # assume fields ["ID","NAME","FEEDER","FEEDER_NUM","USAGEPOINTLOCATION","RATEDPOWER"]
@@ -411,12 +453,12 @@ class ExcelImporter(Importer):
             lv_network:Network = mv_network.getSubTopology(str(row['FEEDER']))
             if lv_network is None:
                 continue
-            usagePointLocation:UsagePointLocation = lv_network.getUsagePointLocation(str(row['USAGEPOINTLOCATION']).replace(".0",""))
+            usagePointLocation:UsagePointLocation = lv_network.getUsagePointLocation(self._cell_id(row['USAGEPOINTLOCATION']))
             if usagePointLocation is None:
                 logger.error("USAGEPOINTLOCATION '{}' not found in USAGEPOINTLOCATIONS".format(row['USAGEPOINTLOCATION']).replace(".0",""))
                 continue
             bus:Bus = usagePointLocation.parent
-            feeder_num = (str(int(row["FEEDER_NUM"])) if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]) else None)
+            feeder_num = self._feeder_num(row)
             up:UsagePoint = bus.addUsagePoint(row['ID'], row['NAME'], usagePointLocation=usagePointLocation, ratedPower=row["RATEDPOWER"], feeder_num=feeder_num)
             usagePointLocation.linkUsagePoint(up)
             
@@ -430,12 +472,12 @@ class ExcelImporter(Importer):
             if lv_network is None:
                 continue
 
-            usagePointLocation:UsagePointLocation = lv_network.getUsagePointLocation(str(row['USAGEPOINTLOCATION']).replace(".0",""))
+            usagePointLocation:UsagePointLocation = lv_network.getUsagePointLocation(self._cell_id(row['USAGEPOINTLOCATION']))
             if usagePointLocation is None:
                 logger.error("USAGEPOINTLOCATION '{}' not found in USAGEPOINTLOCATIONS".format(row['USAGEPOINTLOCATION']).replace(".0",""))
                 continue
             bus:Bus = usagePointLocation.parent
-            feeder_num = (str(int(row["FEEDER_NUM"])) if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]) else None)
+            feeder_num = self._feeder_num(row)
             gen:Generator = bus.addGenerator(row['ID'], row['NAME'], usagePointLocation=usagePointLocation, maxP=row["MAXP"], minP=row["MINP"],
                                             targetP=row["TARGETP"], targetV=row["TARGETV"], targetQ=row["TARGETQ"], minQ=row["MINQ"], maxQ=row["MAXQ"],
                                             controllable=row["CONTROLLABLE"] if 'CONTROLLABLE' in row else None, coords=(row['LATITUDE'], row['LONGITUDE']) if 'LATITUDE' in row and 'LONGITUDE' in row else None, feeder_num=feeder_num)
@@ -448,10 +490,11 @@ class ExcelImporter(Importer):
                 continue
 
             lv_network:Network = mv_network.getSubTopology(row['FEEDER'])
+            usage_point_id = self._cell_id(row['USAGEPOINT'])
             if lv_network is None:
-                load:Load = mv_network.getLoad(str(row['USAGEPOINT']).replace(".0",""))
+                load:Load = mv_network.getLoad(usage_point_id)
                 if load is None:
-                    mvGen:MvGenerator = mv_network.getGenerator(str(row['USAGEPOINT']).replace(".0",""))
+                    mvGen:MvGenerator = mv_network.getGenerator(usage_point_id)
                     if mvGen is None:
                         logger.error("METER '{}' not found in LOADS nor GENERATORS".format(row['ID']).replace(".0",""))
                         continue
@@ -459,10 +502,10 @@ class ExcelImporter(Importer):
                 else:
                     load.addMeter(row['ID'], row['NAME'], p=row['P'], q=row['Q'])
             else:
-                feeder_num = (str(int(row["FEEDER_NUM"])) if 'FEEDER_NUM' in row and not pd.isna(row["FEEDER_NUM"]) else None)
-                usagePoint:UsagePoint = lv_network.getUsagePoint(str(row['USAGEPOINT']).replace(".0",""))
+                feeder_num = self._feeder_num(row)
+                usagePoint:UsagePoint = lv_network.getUsagePoint(usage_point_id)
                 if usagePoint is None:
-                    gen:Generator = lv_network.getGenerator(str(row['USAGEPOINT']).replace(".0",""))
+                    gen:Generator = lv_network.getGenerator(usage_point_id)
                     if gen is None:
                         logger.error("METER '{}' not found in USAGEPOINTS nor DERS".format(row['ID']).replace(".0",""))
                         continue
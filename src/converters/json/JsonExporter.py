@@ -1,4 +1,4 @@
-import aiofiles
+import asyncio
 import json
 import logging
 import math
@@ -24,6 +24,21 @@ from topology import (
 from Utils import Sanitizer
 from base_exporter import Exporter
 
+# Use orjson for the element documents when it is installed, stdlib json otherwise
+try:
+    import orjson
+
+    def dump_document(document: dict) -> bytes:
+        """Serialize an element document to UTF-8 encoded JSON."""
+        return orjson.dumps(document, option=orjson.OPT_SERIALIZE_NUMPY)
+
+except ImportError:
+
+    def dump_document(document: dict) -> bytes:
+        """Serialize an element document to UTF-8 encoded JSON."""
+        return json.dumps(document, ensure_ascii=False).encode("utf8")
+
+
 typeTemplates = {
     "substation": {"shape": "CT", "type": "Substation"},
     "bus": {"shape": "bus", "type": "Bus"},
@@ -160,10 +175,52 @@ typeTemplates = {
     },
 }
 
+# Top-level collections of the exported document, in output order
+collectionNames = [
+    "substations",
+    "buses",
+    "loads",
+    "generators",
+    "transformers",
+    "lines",
+    "switches",
+    "danglingLines",
+    "usagePointLocations",
+    "usagePoints",
+    "meters",
+]
+
+# Two windings transformer attributes exported as pandaPowerParameters
+pandaPowerParameterNames = (
+    "i0_percent",
+    "pfe_kw",
+    "shift_degree",
+    "std_type",
+    "tap_max",
+    "tap_min",
+    "tap_neutral",
+    "tap_pos",
+    "tap_side",
+    "tap_step_degree",
+    "tap_step_percent",
+    "vk_percent",
+    "vkr_percent",
+)
+
+# Static pieces of the exported document, encoded once
+sectionTemplate = b'  "%s": ['
+documentOpen = b"{\n"
+documentClose = b"]\n}\n"
+sectionSeparator = b"],\n"
+elementSeparator = b",\n"
+
 
 class JsonExporter(Exporter):
     """JSON Exporter for exporting topology to JSON format."""
 
+    # Whether transformer documents carry their pandapower parameters
+    export_pandapower_parameters = True
+
     def required_parameters(self) -> dict:
         return {
             "output_file": None,
@@ -177,6 +234,9 @@ class JsonExporter(Exporter):
 
     def __init__(self):
         self.type_templates = typeTemplates
+        self._base_templates = {}
+        self._sanitizers = {}
+        self._sanitized_references = {}
 
     def export_topology_full(
         self,
@@ -215,21 +275,18 @@ class JsonExporter(Exporter):
         network: str,
     ) -> dict:
         """Export a single element to JSON format."""
-        sanitizer = Sanitizer(system, element.prefix)
-        element_id = sanitizer.sanitizeId(element.id)
-        json_obj = self.type_templates[element_type].copy()
-        json_obj.update(
-            {
-                "_id": element_id,
-                "context": context + element_type + "#" + element_id,
-                "mRID": element.id,
-                "name": element.name,
-                "system": system,
-                "network": network,
-            }
+        element_id = self._sanitizer(system, element.prefix).sanitizeId(element.id)
+        base_template, context_prefix = self._base_template(
+            element_type, context, system, network
         )
-        if hasattr(element, "feeder_num") and element.feeder_num is not None:
-            json_obj.update({"feederNumber": element.feeder_num})
+        json_obj = base_template.copy()
+        json_obj["_id"] = element_id
+        json_obj["context"] = context_prefix + element_id
+        json_obj["mRID"] = element.id
+        json_obj["name"] = element.name
+        feeder_num = getattr(element, "feeder_num", None)
+        if feeder_num is not None:
+            json_obj["feederNumber"] = feeder_num
         if isinstance(element, Location) and element.coords:
             json_obj["geometry"] = {
                 "type": "Point",
@@ -242,6 +299,55 @@ class JsonExporter(Exporter):
             }
         return json_obj
 
+    def _sanitizer(self, system: str, prefix: str) -> Sanitizer:
+        """Return the shared sanitizer for a system and element prefix."""
+        key = (system, prefix)
+        sanitizer = self._sanitizers.get(key)
+        if sanitizer is None:
+            sanitizer = self._sanitizers[key] = Sanitizer(system, prefix)
+        return sanitizer
+
+    def _sanitize_reference(self, system: str, prefix: str, id) -> str:
+        """
+        Sanitize the id of a referenced element (bus, substation, location,
+        usage point). The same references appear in many documents, so the
+        results are memoized for the subtopology being exported.
+        """
+        key = (system, prefix, id)
+        sanitized = self._sanitized_references.get(key)
+        if sanitized is None:
+            sanitized = self._sanitizer(system, prefix).sanitizeId(id)
+            self._sanitized_references[key] = sanitized
+        return sanitized
+
+    def _base_template(
+        self, element_type: str, context: str, system: str, network: str
+    ) -> tuple:
+        """
+        Return the type template with the fields shared by every element of
+        an export (system, network and the context prefix) already filled in.
+
+        The per-element fields are kept as placeholders so that the key order
+        of the exported documents does not change.
+        """
+        key = (element_type, context, system, network)
+        base = self._base_templates.get(key)
+        if base is None:
+            template = self.type_templates[element_type].copy()
+            template.update(
+                {
+                    "_id": None,
+                    "context": None,
+                    "mRID": None,
+                    "name": None,
+                    "system": system,
+                    "network": network,
+                }
+            )
+            base = (template, context + element_type + "#")
+            self._base_templates[key] = base
+        return base
+
     def default_parameters(self) -> dict:
         return {
             "file": None,  # Output file path
@@ -259,130 +365,123 @@ class JsonExporter(Exporter):
         system = params.get("system")
 
         result = {}
+        loop = asyncio.get_running_loop()
+        pending_writes = []
+
+        try:
+            for sub_topology in [network] + network.getElements("subTopologies"):
+                if len(output_file_elems) > 1:
+                    output_file = ".".join(output_file_elems[:-1]) + f"_{sub_topology.id}." + output_file_elems[-1]
+                else:
+                    output_file = f"{output_file_elems[0]}_{sub_topology.id}"
 
-        for sub_topology in [network] + network.getElements("subTopologies"):
-            if len(output_file_elems) > 1:
-                output_file = ".".join(output_file_elems[:-1]) + f"_{sub_topology.id}." + output_file_elems[-1]
-            else:
-                output_file = f"{output_file_elems[0]}_{sub_topology.id}"
-
-            logger.info("> Starting JSON exporting '{}'".format(str(output_file)))
-
-            # systems = []
-            substations = []
-            buses = []
-            loads = []
-            usage_point_locations = []
-            usage_points = []
-            generators = []
-            transformers = []
-            lines = []
-            dangling_lines = []
-            switches = []
-            meters = []
-
-            # systems.append(
-            #     self._export_system(
-            #         network, context, system, default_layout_mv, default_layout_lv
-            #     )
-            # )
-
-            for sub in sub_topology.getElements("substations"):
-                substations.append(self._export_substation(sub, context, system, sub_topology.network))
-                for bus in sub.getElements("buses"):
-                    buses.append(self._export_bus(bus, sub.id, context, system, sub_topology.network))
-                    for load in bus.getElements("loads"):
-                        loads.append(self._export_load(load, sub.id, context, system, sub_topology.network))
-                        if len(load.getElements("meters")) > 0:
-                            for meter in load.getElements("meters"):
-                                meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                    for up in bus.getElements("usagePointLocations"):
-                        upl = self._export_usage_point_location(up, sub.id, context, system, sub_topology.network)
-                        usage_point_locations.append(upl)
-                    for u in bus.getElements("usagePoints"):
-                        usage_points.append(self._export_usage_point(u, context, system, sub_topology.network))
-                        if len(u.getElements("meters")) > 0:
-                            for meter in u.getElements("meters"):
-                                meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                    for generator in bus.getElements("generators"):
-                        generators.append(self._export_generator(generator, sub.id, context, system, sub_topology.network))
-                        if len(generator.getElements("meters")) > 0:
-                            for meter in generator.getElements("meters"):
-                                meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                    for dangling_line in bus.getElements("danglingLines"):
-                        dangling_lines.append(self._export_dangling_line(dangling_line, sub.id, context, system, sub_topology.network))
-                for switch in sub.getElements("switches"):
-                    switches.append(self._export_switch(switch, sub.id, context, system, sub_topology.network))
-                for trafo in sub.getElements("twoWindingsTransformers"):
-                    transformers.append(self._export_two_windings_transformer(trafo, sub.id, context, system, sub_topology.network))
-                for trafo in sub.getElements("threeWindingsTransformers"):
-                    transformers.append(self._export_three_windings_transformer(trafo, sub.id, context, system, sub_topology.network))
-                for line in sub.getElements("lines"):
-                    lines.append(self._export_line(line, context, system, sub_topology.network))
-            
-            for bus in sub_topology.getElements("buses"):
-                buses.append(self._export_bus(bus, None, context, system, sub_topology.network))
-                for load in bus.getElements("loads"):
-                    loads.append(self._export_load(load, None, context, system, sub_topology.network))
-                    if len(load.getElements("meters")) > 0:
-                        for meter in load.getElements("meters"):
-                            meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                for up in bus.getElements("usagePointLocations"):
-                    upl = self._export_usage_point_location(up, None, context, system, sub_topology.network)
-                    usage_point_locations.append(upl)
-                for u in bus.getElements("usagePoints"):
-                    usage_points.append(self._export_usage_point(u, context, system, sub_topology.network))
-                    if len(u.getElements("meters")) > 0:
-                        for meter in u.getElements("meters"):
-                            meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                for generator in bus.getElements("generators"):
-                    generators.append(self._export_generator(generator, None, context, system, sub_topology.network))
-                    if len(generator.getElements("meters")) > 0:
-                        for meter in generator.getElements("meters"):
-                            meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                for dangling_line in bus.getElements("danglingLines"):
-                    dangling_lines.append(self._export_dangling_line(dangling_line, None, context, system, sub_topology.network))
-            for switch in sub_topology.getElements("switches"):
-                switches.append(self._export_switch(switch, None, context, system, sub_topology.network))
-            for line in sub_topology.getElements("lines"):
-                lines.append(self._export_line(line, context, system, sub_topology.network))
-
-            async with aiofiles.open(output_file, 'w', encoding="utf8") as output_json:
-                # await output_json.write("db.eter_systems.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_substations.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_buses.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_loads.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_generators.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_transformers.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_lines.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_switches.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_danglingLines.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_usagePointLocations.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_usagePoints.deleteMany({\"context\":/" + context + "/})\n")
-                # await output_json.write("db.eter_meters.deleteMany({\"context\":/" + context + "/})\n")
-
-                await output_json.write("{\n")
-                # await output_json.write("db.eter_systems.insertMany( [" + (",\n".join(systems)) + "])\n")
-                await output_json.write("  \"substations\": [" + (",\n".join(substations)) + "],\n")
-                await output_json.write("  \"buses\": [" + (",\n".join(buses)) + "],\n")
-                await output_json.write("  \"loads\": [" + (",\n".join(loads)) + "],\n")
-                await output_json.write("  \"generators\": [" + (",\n".join(generators)) + "],\n")
-                await output_json.write("  \"transformers\": [" + (",\n".join(transformers)) + "],\n")
-                await output_json.write("  \"lines\": [" + (",\n".join(lines)) + "],\n")
-                await output_json.write("  \"switches\": [" + (",\n".join(switches)) + "],\n")
-                await output_json.write("  \"danglingLines\": [" + (",\n".join(dangling_lines)) + "],\n")
-                await output_json.write("  \"usagePointLocations\": [" + (",\n".join(usage_point_locations)) + "],\n")
-                await output_json.write("  \"usagePoints\": [" + (",\n".join(usage_points)) + "],\n")
-                await output_json.write("  \"meters\": [" + (",\n".join(meters)) + "]\n")
-                await output_json.write("}\n")
-
-                await output_json.flush()
+                logger.info("> Starting JSON exporting '{}'".format(str(output_file)))
+
+                documents = {collection: [] for collection in collectionNames}
+                self._export_sub_topology(sub_topology, context, system, documents)
+
+                # Subtopology files are independent: write this one from a worker
+                # thread while the next subtopology is being built
+                pending_writes.append(
+                    loop.run_in_executor(None, self._write_file, output_file, list(documents.items()))
+                )
 
                 result[sub_topology.id] = Path(output_file)
+        except BaseException:
+            # Let the writes already queued finish (and retrieve their errors) before propagating
+            await asyncio.gather(*pending_writes, return_exceptions=True)
+            raise
 
+        await asyncio.gather(*pending_writes)
         logger.info("Finished JSON exporting!")
         return result
 
+    def _export_sub_topology(
+        self, sub_topology: Network, context: str, system: str, documents: dict
+    ) -> None:
+        """
+        Export every element of a (sub)topology, appending the serialized
+        documents to the matching lists of ``documents`` (see collectionNames).
+        """
+        substations = documents["substations"]
+        buses = documents["buses"]
+        loads = documents["loads"]
+        generators = documents["generators"]
+        transformers = documents["transformers"]
+        lines = documents["lines"]
+        switches = documents["switches"]
+        dangling_lines = documents["danglingLines"]
+        usage_point_locations = documents["usagePointLocations"]
+        usage_points = documents["usagePoints"]
+        meters = documents["meters"]
+
+        network_id = sub_topology.network
+        self._sanitized_references = {}
+
+        for bus, sub in sub_topology.iterAllBuses():
+            # Sanitize the bus and substation ids once for the whole bus sub-tree
+            bus_id = self._sanitize_reference(system, bus.prefix, bus.id)
+            substation_id = self._sanitize_reference(system, bus.prefix, sub.id) if sub is not None else None
+            buses.append(self._export_bus(bus, substation_id, context, system, network_id))
+            for load in bus.getElements("loads"):
+                loads.append(self._export_load(load, bus_id, substation_id, context, system, network_id))
+                for meter in load.getElements("meters"):
+                    meters.append(self._export_meter(meter, context, system, network_id))
+            for up in bus.getElements("usagePointLocations"):
+                usage_point_locations.append(self._export_usage_point_location(up, bus_id, substation_id, context, system, network_id))
+            for u in bus.getElements("usagePoints"):
+                usage_points.append(self._export_usage_point(u, bus_id, context, system, network_id))
+                for meter in u.getElements("meters"):
+                    meters.append(self._export_meter(meter, context, system, network_id))
+            for generator in bus.getElements("generators"):
+                generators.append(self._export_generator(generator, bus_id, substation_id, context, system, network_id))
+                for meter in generator.getElements("meters"):
+                    meters.append(self._export_meter(meter, context, system, network_id))
+            for dangling_line in bus.getElements("danglingLines"):
+                dangling_lines.append(self._export_dangling_line(dangling_line, bus_id, substation_id, context, system, network_id))
+
+        for sub in sub_topology.getElements("substations"):
+            substations.append(self._export_substation(sub, context, system, network_id))
+            substation_id = self._sanitize_reference(system, sub.prefix, sub.id)
+            for switch in sub.getElements("switches"):
+                switches.append(self._export_switch(switch, substation_id, context, system, network_id))
+            for trafo in sub.getElements("twoWindingsTransformers"):
+                transformers.append(self._export_two_windings_transformer(trafo, sub.id, context, system, network_id))
+            for trafo in sub.getElements("threeWindingsTransformers"):
+                transformers.append(self._export_three_windings_transformer(trafo, sub.id, context, system, network_id))
+            for line in sub.getElements("lines"):
+                lines.append(self._export_line(line, context, system, network_id))
+        for switch in sub_topology.getElements("switches"):
+            switches.append(self._export_switch(switch, None, context, system, network_id))
+        for line in sub_topology.getElements("lines"):
+            lines.append(self._export_line(line, context, system, network_id))
+
+    @staticmethod
+    def _iter_document(sections: list):
+        """
+        Yield the encoded document fragment by fragment, one element at a
+        time.
+        """
+        yield documentOpen
+        for index, (section, documents) in enumerate(sections):
+            if index > 0:
+                yield sectionSeparator
+            yield sectionTemplate % section.encode("utf8")
+            for position, document in enumerate(documents):
+                if position > 0:
+                    yield elementSeparator
+                yield document
+        yield documentClose
+
+    @classmethod
+    def _write_file(cls, output_file: str, sections: list) -> None:
+        """
+        Stream an export file straight into the buffered writer, so the whole
+        document is never materialised as one string.
+        """
+        with open(output_file, "wb") as output_json:
+            output_json.writelines(cls._iter_document(sections))
+
     # def _export_system(
     #     self,
     #     topology: Network,
@@ -424,7 +523,7 @@ class JsonExporter(Exporter):
 
     def _export_substation(
         self, substation: Substation, context: str, system: str, network: str
-    ) -> str:
+    ) -> bytes:
         """Export substation information."""
         json_obj = self._export_element(
             substation, "substation", context, system, network
@@ -439,14 +538,13 @@ class JsonExporter(Exporter):
             }
         )
 
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_bus(
         self, element: Bus, substation: str, context: str, system: str, network: str
-    ) -> str:
+    ) -> bytes:
         """Export bus information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "bus", context, system, network)
         json_obj.update(
             {
@@ -459,22 +557,27 @@ class JsonExporter(Exporter):
         if substation is not None:
             json_obj.update(
                 {
-                    "substation": sanitizer.sanitizeId(substation),
+                    "substation": substation,
                 }
             )
 
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_load(
-        self, element: Load, substation: str, context: str, system: str, network: str
-    ) -> str:
+        self,
+        element: Load,
+        bus: str,
+        substation: str,
+        context: str,
+        system: str,
+        network: str,
+    ) -> bytes:
         """Export load information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "load", context, system, network)
         json_obj.update(
             {
-                "bus": sanitizer.sanitizeId(element.parent.id),
+                "bus": bus,
                 "ratedPower": element.p,  # kW
                 "referenceReactivePower": element.q,  # kvar
             }
@@ -482,93 +585,92 @@ class JsonExporter(Exporter):
         if substation is not None:
             json_obj.update(
                 {
-                    "substation": sanitizer.sanitizeId(substation),
+                    "substation": substation,
                 }
             )
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_usage_point_location(
         self,
         element: UsagePointLocation,
+        bus: str,
         substation: str,
         context: str,
         system: str,
         network: str,
-    ) -> str:
+    ) -> bytes:
         """Export usage point location information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(
             element, "usagePointLocation", context, system, network
         )
         json_obj.update(
             {
-                "bus": sanitizer.sanitizeId(element.parent.id),
+                "bus": bus,
             }
         )
         if substation is not None:
             json_obj.update(
                 {
-                    "substation": sanitizer.sanitizeId(substation),
+                    "substation": substation,
                 }
             )
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_usage_point(
-        self, element: Meter, context: str, system: str, network: str
-    ) -> str:
+        self, element: Meter, bus: str, context: str, system: str, network: str
+    ) -> bytes:
         """Export usage point information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "usagePoint", context, system, network)
+        location_id = self._sanitize_reference(system, element.prefix, element.location.id)
         json_obj.update(
             {
-                "bus": sanitizer.sanitizeId(element.parent.id),
-                "usagePointLocation": sanitizer.sanitizeId(element.location.id),
+                "bus": bus,
+                "usagePointLocation": location_id,
             }
         )
         json_obj["cim"].update(
             {
-                "location": sanitizer.sanitizeId(element.location.id),
-                "endDevices": [sanitizer.sanitizeId(element.id)],
+                "location": location_id,
+                "endDevices": [json_obj["_id"]],
                 "ratedPower": element.ratedPower,
                 "Names": {"name": element.name, "NameType": None},
             }
         )
 
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_meter(
         self, element: Meter, context: str, system: str, network: str
-    ) -> str:
+    ) -> bytes:
         """Export meter information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "meter", context, system, network)
         json_obj.update(
             {
-                "usagePoint": sanitizer.sanitizeId(element.parent.id),
+                "usagePoint": self._sanitize_reference(system, element.prefix, element.parent.id),
                 "installedPower": element.p,  # kW
                 "referenceReactivePower": element.q,  # kvar
             }
         )
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_generator(
         self,
         element: Generator,
+        bus: str,
         substation: str,
         context: str,
         system: str,
         network: str,
-    ) -> str:
+    ) -> bytes:
         """Export generator information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "generator", context, system, network)
         json_obj.update(
             {
-                "bus": sanitizer.sanitizeId(element.parent.id),
+                "bus": bus,
                 "controllable": element.controllable,
                 "installedPower": element.maxP,  # kW
             }
@@ -576,10 +678,10 @@ class JsonExporter(Exporter):
         if substation is not None:
             json_obj.update(
                 {
-                    "substation": sanitizer.sanitizeId(substation),
+                    "substation": substation,
                 }
             )
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_two_windings_transformer(
@@ -589,57 +691,48 @@ class JsonExporter(Exporter):
         context: str,
         system: str,
         network: str,
-    ) -> str:
+    ) -> bytes:
         """Export two windings transformer information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(
             element, "transformer", context, system, network
         )
+        prefix = element.prefix
+        bus1, bus2 = element.bus1, element.bus2
+        voltage_level1, voltage_level2 = bus1.voltageLevel, bus2.voltageLevel
         json_obj.update(
             {
-                "substation": sanitizer.sanitizeId(element.parent.id),
-                "bus1": sanitizer.sanitizeId(element.bus1.id),
-                "bus2": sanitizer.sanitizeId(element.bus2.id),
+                "substation": self._sanitize_reference(system, prefix, element.parent.id),
+                "bus1": self._sanitize_reference(system, prefix, bus1.id),
+                "bus2": self._sanitize_reference(system, prefix, bus2.id),
                 "r": element.r,
                 "x": element.x,
                 "g": element.g,
                 "b": element.b,
                 "ratedApparentPower": element.nominal,  # kVA
-                "ratedVoltage1": element.bus1.voltageLevel.nominalV * 1000,  # kV to V
-                "ratedVoltage2": element.bus2.voltageLevel.nominalV * 1000,  # kV to V
-                "voltageLevel1": element.bus1.voltageLevel.id,
-                "voltageLevel2": element.bus2.voltageLevel.id,
+                "ratedVoltage1": voltage_level1.nominalV * 1000,  # kV to V
+                "ratedVoltage2": voltage_level2.nominalV * 1000,  # kV to V
+                "voltageLevel1": voltage_level1.id,
+                "voltageLevel2": voltage_level2.id,
             }
         )
 
-        # Panda Power parameters
-        panda_power_params = {
-            "i0_percent": element.i0_percent,
-            "pfe_kw": element.pfe_kw,
-            "shift_degree": element.shift_degree,
-            "std_type": element.std_type,
-            "tap_max": element.tap_max,
-            "tap_min": element.tap_min,
-            "tap_neutral": element.tap_neutral,
-            "tap_pos": element.tap_pos,
-            "tap_side": element.tap_side,
-            "tap_step_degree": element.tap_step_degree,
-            "tap_step_percent": element.tap_step_percent,
-            "vk_percent": element.vk_percent,
-            "vkr_percent": element.vkr_percent,
-        }
-
-        dict_copy = panda_power_params.copy()
-        for key, value in dict_copy.items():
-            if value is None or value == "" or (isinstance(value, float) and math.isnan(value)):
-                panda_power_params.pop(key)
-
-        if panda_power_params:
-            json_obj.update({"pandaPowerParameters": panda_power_params})
+        # Panda Power parameters, keeping only the ones with a value
+        if self.export_pandapower_parameters:
+            panda_power_params = {
+                name: value
+                for name in pandaPowerParameterNames
+                if not self._is_missing(value := getattr(element, name))
+            }
+            if panda_power_params:
+                json_obj["pandaPowerParameters"] = panda_power_params
 
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
+    @staticmethod
+    def _is_missing(value) -> bool:
+        return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
+
     def _export_three_windings_transformer(
         self,
         element: ThreeWindingsTransformer,
@@ -647,18 +740,21 @@ class JsonExporter(Exporter):
         context: str,
         system: str,
         network: str,
-    ) -> str:
+    ) -> bytes:
         """Export three windings transformer information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(
             element, "transformer", context, system, network
         )
+        prefix = element.prefix
+        bus1, bus2, bus3 = element.bus1, element.bus2, element.bus3
+        voltage_level1, voltage_level2, voltage_level3 = bus1.voltageLevel, bus2.voltageLevel, bus3.voltageLevel
+        rated_star = element.ratedStar
         json_obj.update(
             {
-                "substation": sanitizer.sanitizeId(element.parent.id),
-                "bus1": sanitizer.sanitizeId(element.bus1.id),
-                "bus2": sanitizer.sanitizeId(element.bus2.id),
-                "bus3": sanitizer.sanitizeId(element.bus3.id),
+                "substation": self._sanitize_reference(system, prefix, element.parent.id),
+                "bus1": self._sanitize_reference(system, prefix, bus1.id),
+                "bus2": self._sanitize_reference(system, prefix, bus2.id),
+                "bus3": self._sanitize_reference(system, prefix, bus3.id),
                 "r1": element.r1,
                 "r2": element.r2,
                 "r3": element.r3,
@@ -674,34 +770,34 @@ class JsonExporter(Exporter):
                 "ratedApparentPower1": element.ratedS1,  # kVA
                 "ratedApparentPower2": element.ratedS2,  # kVA
                 "ratedApparentPower3": element.ratedS3,  # kVA
-                "ratedVoltageStarBus": element.ratedStar * 1000,  # kV to V
-                "ratedVoltage1": element.bus1.voltageLevel.nominalV * 1000,  # kV to V
-                "ratedVoltage2": element.bus2.voltageLevel.nominalV * 1000,  # kV to V
-                "ratedVoltage3": element.bus3.voltageLevel.nominalV * 1000,  # kV to V
-                "voltageLevel1": element.bus1.voltageLevel.id,
-                "voltageLevel2": element.bus2.voltageLevel.id,
-                "voltageLevel3": element.bus3.voltageLevel.id,
+                "ratedVoltageStarBus": rated_star * 1000 if rated_star is not None else None,  # kV to V
+                "ratedVoltage1": voltage_level1.nominalV * 1000,  # kV to V
+                "ratedVoltage2": voltage_level2.nominalV * 1000,  # kV to V
+                "ratedVoltage3": voltage_level3.nominalV * 1000,  # kV to V
+                "voltageLevel1": voltage_level1.id,
+                "voltageLevel2": voltage_level2.id,
+                "voltageLevel3": voltage_level3.id,
             }
         )
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_dangling_line(
         self,
         element: DanglingLine,
+        bus: str,
         substation: str,
         context: str,
         system: str,
         network: str,
-    ) -> str:
+    ) -> bytes:
         """Export dangling line information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(
             element, "danglingLine", context, system, network
         )
         json_obj.update(
             {
-                "bus": sanitizer.sanitizeId(element.parent.id),
+                "bus": bus,
                 "type": element.type,
                 "controllable": element.controllable,
             }
@@ -709,44 +805,42 @@ class JsonExporter(Exporter):
         if substation is not None:
             json_obj.update(
                 {
-                    "substation": sanitizer.sanitizeId(substation),
+                    "substation": substation,
                 }
             )
 
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_switch(
         self, element: Switch, substation: str, context: str, system: str, network: str
-    ) -> str:
+    ) -> bytes:
         """Export switch information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "switch", context, system, network)
         json_obj.update(
             {
-                "bus1": sanitizer.sanitizeId(element.bus1.id),
-                "bus2": sanitizer.sanitizeId(element.bus2.id),
+                "bus1": self._sanitize_reference(system, element.prefix, element.bus1.id),
+                "bus2": self._sanitize_reference(system, element.prefix, element.bus2.id),
             }
         )
         if substation is not None:
             json_obj.update(
                 {
-                    "substation": sanitizer.sanitizeId(substation),
+                    "substation": substation,
                 }
             )
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
 
     def _export_line(
         self, element: Line, context: str, system: str, network: str
-    ) -> str:
+    ) -> bytes:
         """Export line information."""
-        sanitizer = Sanitizer(system, element.prefix)
         json_obj = self._export_element(element, "line", context, system, network)
         json_obj.update(
             {
-                "bus1": sanitizer.sanitizeId(element.bus1.id),
-                "bus2": sanitizer.sanitizeId(element.bus2.id),
+                "bus1": self._sanitize_reference(system, element.prefix, element.bus1.id),
+                "bus2": self._sanitize_reference(system, element.prefix, element.bus2.id),
                 "voltageLevel1": element.voltageLevel.id,
                 "voltageLevel2": element.voltageLevel.id,
                 "length": element.length,
@@ -767,11 +861,5 @@ class JsonExporter(Exporter):
             }
         )
 
-        if element.line_shape:
-            json_obj["geometry"] = {
-                "type": "LineString",
-                "coordinates": [coords[::-1] for coords in element.line_shape],
-            }
-
-        output = json.dumps(json_obj, ensure_ascii=False)
+        output = dump_document(json_obj)
         return output
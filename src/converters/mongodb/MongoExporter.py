@@ -1,154 +1,25 @@
-import json
 import logging
 from pathlib import Path
-from topology import Element, Bus, LineShape, Meter, Switch, Network, UsagePointLocation, VoltageLevel, Substation, TwoWindingsTransformer, ThreeWindingsTransformer, Line, Load, Generator, DanglingLine, Location
-from Utils import Sanitizer
-from base_exporter import Exporter
+from topology import Network
+from converters.json.JsonExporter import JsonExporter, collectionNames, dump_document, elementSeparator
 import aiofiles
-        
-typeTemplates = {
-    "substation": { "shape" : "CT", "type" : "Substation" },
-    "bus": { "shape" : "bus","type" : "Bus" },
-    "load": { "shape" : "pod","type" : "Load" },
-    "generator": { "shape" : "generator","type" : "Generator" },
-    "transformer": { "shape" : "transformer","type" : "Transformer" },
-    "line": { "shape" : "line","type" : "Line" },
-    "switch": { "shape" : "switch","type" : "Switch" },
-    "shuntCompensator": { "shape" : "shuntCompensator","type" : "ShuntCompensator"},
-    "danglingLine": { "shape" : "danglingLine","type" : "DanglingLine" },
-    "usagePointLocation": { "shape" : "pod","type" : "UsagePointLocation" },
-    "usagePoint": {
-        "shape" : "pod",
-        "type" : "UsagePoint",
-        "cim": {
-            "amiBillingReady" : 4,
-            "amiBillingReadySpecified" : True,
-            "checkBilling" : False,
-            "checkBillingSpecified" : False,
-            "connectionState" : 1,
-            "connectionStateSpecified" : True,
-            "estimatedLoad" : 0,
-            "estimatedLoadSpecified" : False,
-            "grounded" : False,
-            "groundedSpecified" : False,
-            "isSdp" : True,
-            "isSdpSpecified" : True,
-            "isVirtual" : False,
-            "isVirtualSpecified" : True,
-            "minimalUsageExpected" : True,
-            "minimalUsageExpectedSpecified" : True,
-            "nominalServiceVoltage" : 220.0,
-            "nominalServiceVoltageSpecified" : True,
-            "outageRegion" : None,
-            "phaseCode" : 0,
-            "phaseCodeSpecified" : False,
-            "ratedCurrent" : 0.0,
-            "ratedCurrentSpecified" : False,
-            "ratedPowerSpecified" : True,
-            "readCycle" : None,
-            "readRoute" : None,
-            "serviceDeliveryRemark" : None,
-            "servicePriority" : None,
-            "ConfigurationEvents" : None,
-            "Equipments" : {
-                "mRID" : None,
-                "Names" : None
-            },
-            "MetrologyRequirements" : None,
-            "PricingStructures" : None,
-            "ServiceCategory" : None,
-            "ServiceLocation" : None,
-            "ServiceMultipliers" : None,
-            "ServiceSupplier" : None,
-        }
-    },
-    "meter": {
-        "shape": "meter",
-        "type": "Meter",
-        "isVirtual": False,
-        "cim": {
-            "amrSystem": "ÉTER",
-            "ActivityRecords": [],
-            "ComFunction": [],
-            "ConfigurationEvents": {},
-            "ConnectDisconnectFunction": "",
-            "EndDeviceInfo": {
-                "isSolidState": True,
-                "phaseCount": "unknown",
-                "ratedCurrent": 0,
-                "ratedVoltage": 0,
-                "AssetModel": {
-                    "corporateStandardKind": "",
-                    "modelNumber": 1,
-                    "modelVersion": 1,
-                    "usageKind": "",
-                    "Manufacturer": {
-                        "mRID": None
-                    }
-                },
-                "capability": {
-                    "autonomousDst": True,
-                    "communication": True,
-                    "connectDisconnect": True,
-                    "demandResponse": True,
-                    "electricMetering": True,
-                    "gasMetering": False,
-                    "metrology": True,
-                    "onRequestRead": True,
-                    "outageHistory": True,
-                    "pressureCompensation": False,
-                    "pricingInfo": True,
-                    "pulseOutput": True,
-                    "relaysProgramming": True,
-                    "reverseFlow": True,
-                    "superCompressibilityCompensation": False,
-                    "temperatureCompensation": False,
-                    "textMessage": True,
-                    "waterMetering": False
-                }
-            },
-            "MeterMultipliers": [],
-            "Names": "",
-            "Seals": [],
-            "SimpleEndDeviceFunction": "",
-            "electronicAddress": {
-                "email1": "notused",
-                "email2": "notused",
-                "lan": "",
-                "mac": "",
-                "password": "notused",
-                "radio": "notused",
-                "userID": "notused",
-                "web": ""
-            },
-            "features": "",
-            "formNumber": "Meter",
-            "initialCondition": "new",
-            "initialLossOfLife": 0,
-            "initialLossOfLifeSpecified": True,
-            "isVirtual": False,
-            "isVirtualSpecified": True,
-            "lifecycle": {
-                "installationDate": "",
-                "manufacturedDate": "",
-                "purchaseDate": "",
-                "receivedDate": "",
-                "removalDate": "",
-                "retiredDate": ""
-            },
-            "lotNumber": "",
-            "purchasePrice": 0,
-            "purchasePriceSpecified": True,
-            "serialNumber": "",
-            "timeZoneOffset": 2,
-            "timeZoneOffsetSpecified": True,
-            "utcNumber": ""
-        }
-    }
-}
 
-class MongoExporter(Exporter):
-    """MongoDB Exporter for exporting topology to MongoDB format."""
+# Statement templates for the generated mongo shell script, encoded once
+deleteManyTemplate = b'db.%s.deleteMany({"context":/%s/})\n'
+insertManyTemplate = b'db.%s.insertMany(['
+insertManyClose = b"])\n"
+
+class MongoExporter(JsonExporter):
+    """
+    MongoDB Exporter for exporting topology to MongoDB format.
+
+    Element documents are built by the JsonExporter helpers; this exporter only
+    gathers every subtopology into a single mongo shell script.
+    """
+
+    # Transformer documents in mongo do not carry the pandapower parameters
+    export_pandapower_parameters = False
+
     def required_parameters(self) -> dict:
         return {
             "output_file": None,
@@ -162,9 +33,6 @@ class MongoExporter(Exporter):
     def name(cls) -> str:
         return "MongoExporter"
 
-    def __init__(self):
-        self.type_templates = typeTemplates
-
     def export_topology_full(self, topology: Network, file: str, context: str, system: str,
                             default_layout_mv: str, default_layout_lv: str, logger: logging.Logger) -> bool:
         """
@@ -191,36 +59,6 @@ class MongoExporter(Exporter):
         }
         return self._export_topology_impl(topology, logger, params)
     
-    def _export_element(self, element: Element, element_type: str, context: str, 
-                       system: str, network: str) -> dict:
-        """Export a single element to MongoDB format."""
-        sanitizer = Sanitizer(system, element.prefix)
-        element_id = sanitizer.sanitizeId(element.id)
-        json_obj = self.type_templates[element_type].copy()
-        json_obj.update({
-            "_id": element_id,
-            "context": context + element_type + "#" + element_id,
-            "mRID": element.id,
-            "name": element.name,
-            "system": system,
-            "network": network,
-        })
-        if hasattr(element, 'feeder_num') and element.feeder_num is not None:
-            json_obj.update({
-                "feederNumber": element.feeder_num
-            })
-        if isinstance(element, Location) and element.coords:
-            json_obj["geometry"] = {
-                "type": "Point",
-                "coordinates": element.coords[::-1]  # [lat, lon] to [lon, lat]
-            }
-        if isinstance(element, LineShape) and element.line_shape:
-            json_obj["geometry"] = {
-                "type": "LineString",
-                "coordinates": [coords[::-1] for coords in element.line_shape]
-            }
-        return json_obj
-
     def default_parameters(self) -> dict:
         return {
             "file": None,  # Output file path
@@ -240,116 +78,37 @@ class MongoExporter(Exporter):
         default_layout_lv = params.get("layout_lv")
 
 
-        systems = []
-        substations = []
-        buses = []
-        loads = []
-        usage_point_locations = []
-        usage_points = []
-        generators = []
-        trafos = []
-        lines = []
-        dangling_lines = []
-        switches = []
-        meters = []
-
         logger.info("> Starting mongoDB exporting '{}'".format(str(output_file)))
 
-        systems.append(self._export_system(network, context, system, default_layout_mv, default_layout_lv))
+        documents = {"systems": [self._export_system(network, context, system, default_layout_mv, default_layout_lv)]}
+        documents.update({collection: [] for collection in collectionNames})
         for sub_topology in [network] + network.getElements("subTopologies"):
-            for sub in sub_topology.getElements("substations"):
-                substations.append(self._export_substation(sub, context, system, sub_topology.network))
-                for bus in sub.getElements("buses"):
-                    buses.append(self._export_bus(bus, sub.id, context, system, sub_topology.network))
-                    for load in bus.getElements("loads"):
-                        loads.append(self._export_load(load, sub.id, context, system, sub_topology.network))
-                        if len(load.getElements("meters")) > 0:
-                            for meter in load.getElements("meters"):
-                                meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                    for up in bus.getElements("usagePointLocations"):
-                        upl = self._export_usage_point_location(up, sub.id, context, system, sub_topology.network)
-                        usage_point_locations.append(upl)
-                    for u in bus.getElements("usagePoints"):
-                        usage_points.append(self._export_usage_point(u, context, system, sub_topology.network))
-                        if len(u.getElements("meters")) > 0:
-                            for meter in u.getElements("meters"):
-                                meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                    for generator in bus.getElements("generators"):
-                        generators.append(self._export_generator(generator, sub.id, context, system, sub_topology.network))
-                        if len(generator.getElements("meters")) > 0:
-                            for meter in generator.getElements("meters"):
-                                meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                    for dangling_line in bus.getElements("danglingLines"):
-                        dangling_lines.append(self._export_dangling_line(dangling_line, sub.id, context, system, sub_topology.network))
-                for switch in sub.getElements("switches"):
-                    switches.append(self._export_switch(switch, sub.id, context, system, sub_topology.network))
-                for trafo in sub.getElements("twoWindingsTransformers"):
-                    trafos.append(self._export_two_windings_transformer(trafo, sub.id, context, system, sub_topology.network))
-                for trafo in sub.getElements("threeWindingsTransformers"):
-                    trafos.append(self._export_three_windings_transformer(trafo, sub.id, context, system, sub_topology.network))
-                for line in sub.getElements("lines"):
-                    lines.append(self._export_line(line, context, system, sub_topology.network))
-            
-            for bus in sub_topology.getElements("buses"):
-                buses.append(self._export_bus(bus, None, context, system, sub_topology.network))
-                for load in bus.getElements("loads"):
-                    loads.append(self._export_load(load, None, context, system, sub_topology.network))
-                    if len(load.getElements("meters")) > 0:
-                        for meter in load.getElements("meters"):
-                            meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                for up in bus.getElements("usagePointLocations"):
-                    upl = self._export_usage_point_location(up, None, context, system, sub_topology.network)
-                    usage_point_locations.append(upl)
-                for u in bus.getElements("usagePoints"):
-                    usage_points.append(self._export_usage_point(u, context, system, sub_topology.network))
-                    if len(u.getElements("meters")) > 0:
-                        for meter in u.getElements("meters"):
-                            meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                for generator in bus.getElements("generators"):
-                    generators.append(self._export_generator(generator, None, context, system, sub_topology.network))
-                    if len(generator.getElements("meters")) > 0:
-                        for meter in generator.getElements("meters"):
-                            meters.append(self._export_meter(meter, context, system, sub_topology.network))
-                for dangling_line in bus.getElements("danglingLines"):
-                    dangling_lines.append(self._export_dangling_line(dangling_line, None, context, system, sub_topology.network))
-            for switch in sub_topology.getElements("switches"):
-                switches.append(self._export_switch(switch, None, context, system, sub_topology.network))
-            for line in sub_topology.getElements("lines"):
-                lines.append(self._export_line(line, context, system, sub_topology.network))
-
-        async with aiofiles.open(output_file, 'w', encoding="utf8") as output_mongo:
-            await output_mongo.write("db.eter_systems.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_substations.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_buses.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_loads.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_generators.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_transformers.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_lines.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_switches.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_danglingLines.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_usagePointLocations.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_usagePoints.deleteMany({\"context\":/" + context + "/})\n")
-            await output_mongo.write("db.eter_meters.deleteMany({\"context\":/" + context + "/})\n")
+            self._export_sub_topology(sub_topology, context, system, documents)
 
-            await output_mongo.write("db.eter_systems.insertMany( [" + (",\n".join(systems)) + "])\n")
-            await output_mongo.write("db.eter_substations.insertMany( [" + (",\n".join(substations)) + "])\n")
-            await output_mongo.write("db.eter_buses.insertMany([" + (",\n".join(buses)) + "])\n")
-            await output_mongo.write("db.eter_loads.insertMany([" + (",\n".join(loads)) + "])\n")
-            await output_mongo.write("db.eter_generators.insertMany([" + (",\n".join(generators)) + "])\n")
-            await output_mongo.write("db.eter_transformers.insertMany([" + (",\n".join(trafos)) + "])\n")
-            await output_mongo.write("db.eter_lines.insertMany([" + (",\n".join(lines)) + "])\n")
-            await output_mongo.write("db.eter_switches.insertMany([" + (",\n".join(switches)) + "])\n")
-            await output_mongo.write("db.eter_danglingLines.insertMany([" + (",\n".join(dangling_lines)) + "])\n")
-            await output_mongo.write("db.eter_usagePointLocations.insertMany([" + (",\n".join(usage_point_locations)) + "])\n")
-            await output_mongo.write("db.eter_usagePoints.insertMany([" + (",\n".join(usage_points)) + "])\n")
-            await output_mongo.write("db.eter_meters.insertMany([" + (",\n".join(meters)) + "])\n")
+        collections = [("eter_" + collection, items) for collection, items in documents.items()]
 
-            await output_mongo.flush()
+        # Stream the script statement by statement, one document at a time,
+        # instead of materialising it as a single string
+        async with aiofiles.open(output_file, 'wb') as output_mongo:
+            await output_mongo.writelines(self._iter_statements(context, collections))
         logger.info("Finished mongoDB exporting!")
         return { (network.id): Path(output_file) }
 
+    def _iter_statements(self, context: str, collections: list):
+        """Yield the encoded mongo script fragment by fragment."""
+        encoded_context = context.encode("utf8")
+        for collection, _ in collections:
+            yield deleteManyTemplate % (collection.encode("utf8"), encoded_context)
+        for collection, documents in collections:
+            yield insertManyTemplate % collection.encode("utf8")
+            for position, document in enumerate(documents):
+                if position > 0:
+                    yield elementSeparator
+                yield document
+            yield insertManyClose
+
     def _export_system(self, topology: Network, context: str, system: str, 
-                      default_layout_mv: str, default_layout_lv: str) -> str:
+                      default_layout_mv: str, default_layout_lv: str) -> bytes:
         """Export system information."""
         networks = {}
         
@@ -370,249 +129,12 @@ class MongoExporter(Exporter):
                 "elements": {}
             }
 
-        output = json.dumps({
+        output = dump_document({
             "_id": system,
             "name": system,
             "context": context,
             "powSyBl": {
                 "networks": list(networks.values())
             }
-        }, ensure_ascii=False)
-        return output
-    
-    def _export_substation(self, substation: Substation, context: str, 
-                          system: str, network: str) -> str:
-        """Export substation information."""
-        json_obj = self._export_element(substation, "substation", context, system, network)
-        json_obj.update({
-            "voltageLevels": sorted(list({bus.voltageLevel.id for bus in substation.getElements("buses")}))
-        })
-        
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_bus(self, element: Bus, substation: str, context: str, 
-                   system: str, network: str) -> str:
-        """Export bus information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "bus", context, system, network)
-        json_obj.update({
-            "voltageLevel": element.voltageLevel.id,
-            "nominalVoltage": element.voltageLevel.nominalV * 1000,  # kV to V
-            "type": element.voltageLevel.type
-        })
-
-        if substation is not None:
-            json_obj.update({
-                "substation": sanitizer.sanitizeId(substation),
-            })
-
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_load(self, element: Load, substation: str, context: str, 
-                    system: str, network: str) -> str:
-        """Export load information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "load", context, system, network)
-        json_obj.update({
-            "bus": sanitizer.sanitizeId(element.parent.id),
-            "ratedPower": element.p,  # kW
-            "referenceReactivePower": element.q  # kvar
         })
-        if substation is not None:
-            json_obj.update({
-                "substation": sanitizer.sanitizeId(substation),
-            })
-        output = json.dumps(json_obj, ensure_ascii=False)
         return output
-
-    def _export_usage_point_location(self, element: UsagePointLocation, substation: str, 
-                                    context: str, system: str, network: str) -> str:
-        """Export usage point location information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "usagePointLocation", context, system, network)
-        json_obj.update({
-            "bus": sanitizer.sanitizeId(element.parent.id),
-        })
-        if substation is not None:
-            json_obj.update({
-                "substation": sanitizer.sanitizeId(substation),
-            })
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_usage_point(self, element: Meter, context: str, system: str, network: str) -> str:
-        """Export usage point information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "usagePoint", context, system, network)
-        json_obj.update({
-            "bus": sanitizer.sanitizeId(element.parent.id),
-            "usagePointLocation": sanitizer.sanitizeId(element.location.id),
-        })
-        json_obj["cim"].update({
-            "location": sanitizer.sanitizeId(element.location.id),
-            "endDevices": [sanitizer.sanitizeId(element.id)],
-            "ratedPower": element.ratedPower,
-            "Names": {
-                "name": element.name,
-                "NameType": None
-            },
-        })
-        
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_meter(self, element: Meter, context: str, system: str, network: str) -> str:
-        """Export meter information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "meter", context, system, network)
-        json_obj.update({
-            "usagePoint": sanitizer.sanitizeId(element.parent.id),
-            "installedPower": element.p,  # kW
-            "referenceReactivePower": element.q,  # kvar
-        })
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_generator(self, element: Generator, substation: str, context: str, 
-                         system: str, network: str) -> str:
-        """Export generator information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "generator", context, system, network)
-        json_obj.update({
-            "bus": sanitizer.sanitizeId(element.parent.id),
-            "controllable": element.controllable,
-            "installedPower": element.maxP,  # kW
-        })
-        if substation is not None:
-            json_obj.update({
-                "substation": sanitizer.sanitizeId(substation),
-            })
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_two_windings_transformer(self, element: TwoWindingsTransformer, substation: str, 
-                                        context: str, system: str, network: str) -> str:
-        """Export two windings transformer information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "transformer", context, system, network)
-        json_obj.update({
-            "substation": sanitizer.sanitizeId(element.parent.id),
-            "bus1": sanitizer.sanitizeId(element.bus1.id),
-            "bus2": sanitizer.sanitizeId(element.bus2.id),
-            "r": element.r,
-            "x": element.x,
-            "g": element.g,
-            "b": element.b,
-            "ratedApparentPower": element.nominal,  # kVA
-            "ratedVoltage1": element.bus1.voltageLevel.nominalV * 1000,  # kV to V
-            "ratedVoltage2": element.bus2.voltageLevel.nominalV * 1000,  # kV to V
-            "voltageLevel1": element.bus1.voltageLevel.id,
-            "voltageLevel2": element.bus2.voltageLevel.id,
-        })
-        
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_three_windings_transformer(self, element: ThreeWindingsTransformer, substation: str, 
-                                          context: str, system: str, network: str) -> str:
-        """Export three windings transformer information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "transformer", context, system, network)
-        json_obj.update({
-            "substation": sanitizer.sanitizeId(element.parent.id),
-            "bus1": sanitizer.sanitizeId(element.bus1.id),
-            "bus2": sanitizer.sanitizeId(element.bus2.id),
-            "bus3": sanitizer.sanitizeId(element.bus3.id),
-            "r1": element.r1,
-            "r2": element.r2,
-            "r3": element.r3,
-            "x1": element.x1,
-            "x2": element.x2,
-            "x3": element.x3,
-            "g1": element.g1,
-            "g2": element.g2,
-            "g3": element.g3,
-            "b1": element.b1,
-            "b2": element.b2,
-            "b3": element.b3,
-            "ratedApparentPower1": element.ratedS1,  # kVA
-            "ratedApparentPower2": element.ratedS2,  # kVA
-            "ratedApparentPower3": element.ratedS3,  # kVA
-            "ratedVoltageStarBus": element.ratedStar * 1000,  # kV to V
-            "ratedVoltage1": element.bus1.voltageLevel.nominalV * 1000,  # kV to V
-            "ratedVoltage2": element.bus2.voltageLevel.nominalV * 1000,  # kV to V
-            "ratedVoltage3": element.bus3.voltageLevel.nominalV * 1000,  # kV to V
-            "voltageLevel1": element.bus1.voltageLevel.id,
-            "voltageLevel2": element.bus2.voltageLevel.id,
-            "voltageLevel3": element.bus3.voltageLevel.id,
-        })
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_dangling_line(self, element: DanglingLine, substation: str, context: str, 
-                             system: str, network: str) -> str:
-        """Export dangling line information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "danglingLine", context, system, network)
-        json_obj.update({
-            "bus": sanitizer.sanitizeId(element.parent.id),
-            "type": element.type,
-            "controllable": element.controllable,
-        })
-        if substation is not None:
-            json_obj.update({
-                "substation": sanitizer.sanitizeId(substation),
-            })
-
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_switch(self, element: Switch, substation: str, context: str, 
-                      system: str, network: str) -> str:
-        """Export switch information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "switch", context, system, network)
-        json_obj.update({
-            "bus1": sanitizer.sanitizeId(element.bus1.id),
-            "bus2": sanitizer.sanitizeId(element.bus2.id),
-        })
-        if substation is not None:
-            json_obj.update({
-                "substation": sanitizer.sanitizeId(substation),
-            })
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
-    def _export_line(self, element: Line, context: str, system: str, network: str) -> str:
-        """Export line information."""
-        sanitizer = Sanitizer(system, element.prefix)
-        json_obj = self._export_element(element, "line", context, system, network)
-        json_obj.update({
-            "bus1": sanitizer.sanitizeId(element.bus1.id),
-            "bus2": sanitizer.sanitizeId(element.bus2.id),
-            "voltageLevel1": element.voltageLevel.id,
-            "voltageLevel2": element.voltageLevel.id,
-            "length": element.length,
-            "shape": element.type,
-            "type": element.type,
-            "cable": str(element.cable),
-            "currentLimit": element.currentLimit if element.currentLimit and element.currentLimit > 0 else None,
-            "r": element.r,
-            "g1": element.g1,
-            "g2": element.g2,
-            "b1": element.b1,
-            "b2": element.b2,
-            "x": element.x,
-        })
-        
-        if element.line_shape:
-            json_obj["geometry"] = {
-                "type": "LineString",
-                "coordinates": [coords[::-1] for coords in element.line_shape]
-            }
-
-        output = json.dumps(json_obj, ensure_ascii=False)
-        return output
-
@@ -15,6 +15,10 @@ import traceback
 
 class PandapowerExporter(Exporter):
 
+    # Switch.open holds 'True'/'False' (see Switch.__init__); raw bools and
+    # 0/1 are accepted too. Anything else is exported as a closed switch.
+    _closed_by_open_state = {'True': False, True: False, 'False': True, False: True}
+
     @classmethod
     def name(cls) -> str:
         return "PandapowerExporter"
@@ -75,14 +79,20 @@ class PandapowerExporter(Exporter):
         # Track mappings between topology and pandapower indices
         bus_mapping: Dict[str, int] = {}  # topology bus ID -> pandapower bus index
         
+        # Standalone buses first, then buses from substations: collected once
+        # for every table built from the elements attached to the buses
+        buses = list(network.getElements("buses"))
+        for substation in network.getElements("substations"):
+            buses.extend(substation.getElements("buses"))
+        
         # Step 1: Export voltage levels and buses
-        self._export_buses(network, pp_net, bus_mapping, logger)
+        self._export_buses(network, buses, pp_net, bus_mapping, logger)
         
         # Step 2: Export loads
-        self._export_loads(network, pp_net, bus_mapping, logger)
+        self._export_loads(network, buses, pp_net, bus_mapping, logger)
         
         # Step 3: Export generators
-        self._export_generators(network, pp_net, bus_mapping, logger)
+        self._export_generators(network, buses, pp_net, bus_mapping, logger)
         
         # Step 4: Export lines
         self._export_lines(network, pp_net, bus_mapping, logger)
@@ -93,31 +103,31 @@ class PandapowerExporter(Exporter):
         # Step 6: Export switches
         self._export_switches(network, pp_net, bus_mapping, logger)
         
-        self._export_dangling_lines(network, pp_net, bus_mapping, logger)
+        self._export_dangling_lines(network, buses, pp_net, bus_mapping, logger)
         return pp_net
     
-    def _export_buses(self, network: Network, pp_net, bus_mapping: Dict[str, int], logger):
+    def _export_buses(self, network: Network, buses: List[Bus], pp_net, bus_mapping: Dict[str, int], logger):
         """Export buses from topology Network to pandapower bus table."""
-        bus_count = 0
         system = network.system if hasattr(network, 'system') else ""
 
-        # Export standalone buses
-        for bus in network.getElements("buses"):
-            pp_bus_idx = self._create_pandapower_bus(pp_net, bus, system, logger)
-            bus_mapping[bus.id] = pp_bus_idx
-            bus_count += 1
-        
-        # Export buses from substations
-        for substation in network.getElements("substations"):
-            for bus in substation.getElements("buses"):
-                pp_bus_idx = self._create_pandapower_bus(pp_net, bus, system, logger)
-                bus_mapping[bus.id] = pp_bus_idx
-                bus_count += 1
+        # Collect the column values and create the whole bus table in one call
+        vn_kv = [None] * len(buses)
+        names = [None] * len(buses)
+        types = [None] * len(buses)
+        for i, bus in enumerate(buses):
+            vn_kv[i], types[i] = self._pandapower_bus_parameters(bus)
+            names[i] = (system + "_" if system else "") + bus.getId(bus.id)
+
+        if buses:
+            pp_bus_indices = pp.create_buses(pp_net, len(buses), vn_kv=vn_kv, name=names, type=types, in_service=True)
+            for bus, name, pp_bus_idx in zip(buses, names, pp_bus_indices):
+                bus_mapping[bus.id] = int(pp_bus_idx)
+                logger.debug(f"Created pandapower bus {name} for topology bus {bus.id}")
         
-        logger.info(f"Exported {bus_count} buses")
+        logger.info(f"Exported {len(buses)} buses")
     
-    def _create_pandapower_bus(self, pp_net, bus: Bus, system: str, logger):
-        """Create a single pandapower bus from topology Bus."""
+    def _pandapower_bus_parameters(self, bus: Bus):
+        """Return the nominal voltage and pandapower bus type of a topology Bus."""
         # Get nominal voltage from voltage level
         vn_kv = bus.voltageLevel.nominalV if bus.voltageLevel else 1.0
         
@@ -129,31 +139,15 @@ class PandapowerExporter(Exporter):
         else:
             bus_type = 'm'  # node for LV
         
-        # Create pandapower bus
-        pp_bus_idx = pp.create_bus(
-            pp_net,
-            vn_kv=vn_kv,
-            name=(system + "_" if system else "") + bus.getId(bus.id),
-            type=bus_type,
-            in_service=True
-        )
-        
-        logger.debug(f"Created pandapower bus {system + '_' if system else ''}{bus.getId(bus.id)} for topology bus {bus.id}")
-        return pp_bus_idx
+        return vn_kv, bus_type
     
-    def _export_dangling_lines(self, network: Network, pp_net, bus_mapping: Dict[str, int], logger):
+    def _export_dangling_lines(self, network: Network, buses: List[Bus], pp_net, bus_mapping: Dict[str, int], logger):
         dl_count = 0
         system = network.system if hasattr(network, 'system') else ""
 
-        # Process loads from standalone buses
-        for bus in network.getElements("buses"):
+        for bus in buses:
             dl_count += self._export_bus_dangling_lines(bus, pp_net, bus_mapping, system, logger)
         
-        # Process loads from substation buses
-        for substation in network.getElements("substations"):
-            for bus in substation.getElements("buses"):
-                dl_count += self._export_bus_dangling_lines(bus, pp_net, bus_mapping, system, logger)
-        
         logger.info(f"Exported {dl_count} loads")
 
     def _export_bus_dangling_lines(self, bus: Bus, pp_net, bus_mapping: Dict[str, int], system: str, logger):
@@ -179,85 +173,68 @@ class PandapowerExporter(Exporter):
           
     
 
-    def _export_loads(self, network: Network, pp_net, bus_mapping: Dict[str, int], logger):
+    def _export_loads(self, network: Network, buses: List[Bus], pp_net, bus_mapping: Dict[str, int], logger):
         """Export loads from topology Network to pandapower load table."""
-        load_count = 0
         system = network.system if hasattr(network, 'system') else ""
         
-        # Process loads from standalone buses
-        for bus in network.getElements("buses"):
-            load_count += self._export_bus_loads(bus, pp_net, bus_mapping, system, logger)
+        # Loads and usage points are gathered column by column and the load table is created in one call
+        columns = {column: [] for column in ('bus', 'p_mw', 'q_mvar', 'name', 'type')}
+        for bus in buses:
+            self._export_bus_loads(bus, columns, bus_mapping, system, logger)
         
-        # Process loads from substation buses
-        for substation in network.getElements("substations"):
-            for bus in substation.getElements("buses"):
-                load_count += self._export_bus_loads(bus, pp_net, bus_mapping, system, logger)
+        load_count = len(columns['bus'])
+        if load_count:
+            pp.create_loads(
+                pp_net,
+                buses=columns['bus'],
+                p_mw=columns['p_mw'],
+                q_mvar=columns['q_mvar'],
+                name=columns['name'],
+                in_service=True,
+                type=columns['type']
+            )
         
         logger.info(f"Exported {load_count} loads")
     
-    def _export_bus_loads(self, bus: Bus, pp_net, bus_mapping: Dict[str, int], system: str, logger):
-        """Export loads from a single bus."""
-        load_count = 0
-        
+    def _export_bus_loads(self, bus: Bus, columns: Dict[str, list], bus_mapping: Dict[str, int], system: str, logger):
+        """Append the load table rows of the loads and usage points of a single bus."""
         if bus.id not in bus_mapping:
             logger.warning(f"Bus {bus.id} not found in mapping for loads")
-            return 0
+            return
         
         pp_bus_idx = bus_mapping[bus.id]
         
         load:Load
         for load in bus.getElements("loads"):
-            pp.create_load(
-                pp_net,
-                bus=pp_bus_idx,
-                p_mw=load.p,
-                q_mvar=load.q,
-                name=(system + "_" if system else "") + load.getId(load.id),
-                in_service=True,
-                type=load.type if hasattr(load, 'type') else 'wye'
-            )
-            load_count += 1
-            logger.debug(f"Created load {system + '_' if system else ''}{load.getId(load.id)} on bus {pp_bus_idx}")
+            columns['bus'].append(pp_bus_idx)
+            columns['p_mw'].append(load.p)
+            columns['q_mvar'].append(load.q)
+            columns['name'].append((system + "_" if system else "") + load.getId(load.id))
+            columns['type'].append(load.type if hasattr(load, 'type') else 'wye')
+            logger.debug(f"Created load {columns['name'][-1]} on bus {pp_bus_idx}")
             
         usage_point:UsagePoint = None
         for usage_point in bus.getElements("usagePoints"):
-            pp.create_load(
-                pp_net,
-                bus=pp_bus_idx,
-                p_mw=usage_point.ratedPower,
-                q_mvar=0,
-                name= (system + "_" if system else "") +  usage_point.getId(usage_point.id),
-                in_service=True,
-                type=usage_point.type if hasattr(usage_point, 'type') else 'wye'
-            )
-            load_count += 1
-            logger.debug(f"Created load (usage point) {system + '_' if system else ''}{usage_point.getId(usage_point.id)} on bus {pp_bus_idx}")
-
-        
-        return load_count
+            columns['bus'].append(pp_bus_idx)
+            columns['p_mw'].append(usage_point.ratedPower)
+            columns['q_mvar'].append(0)
+            columns['name'].append((system + "_" if system else "") + usage_point.getId(usage_point.id))
+            columns['type'].append(usage_point.type if hasattr(usage_point, 'type') else 'wye')
+            logger.debug(f"Created load (usage point) {columns['name'][-1]} on bus {pp_bus_idx}")
     
-    def _export_generators(self, network: Network, pp_net, bus_mapping: Dict[str, int], logger):
+    def _export_generators(self, network: Network, buses: List[Bus], pp_net, bus_mapping: Dict[str, int], logger):
         """Export generators from topology Network to pandapower generator tables."""
         gen_count = 0
         sgen_count = 0
         ext_grid_count = 0
         system = network.system if hasattr(network, 'system') else ""
         
-        # Process generators from standalone buses
-        for bus in network.getElements("buses"):
+        for bus in buses:
             counts = self._export_bus_generators(bus, pp_net, bus_mapping, system, logger)
             gen_count += counts[0]
             sgen_count += counts[1]
             ext_grid_count += counts[2]
         
-        # Process generators from substation buses
-        for substation in network.getElements("substations"):
-            for bus in substation.getElements("buses"):
-                counts = self._export_bus_generators(bus, pp_net, bus_mapping, system, logger)
-                gen_count += counts[0]
-                sgen_count += counts[1]
-                ext_grid_count += counts[2]
-        
         logger.info(f"Exported {gen_count} generators, {sgen_count} static generators, {ext_grid_count} external grids")
     
     def _export_bus_generators(self, bus: Bus, pp_net, bus_mapping: Dict[str, int], system: str, logger):
@@ -328,35 +305,41 @@ class PandapowerExporter(Exporter):
     
     def _export_lines(self, network: Network, pp_net, bus_mapping: Dict[str, int], logger):
         """Export lines from topology Network to pandapower line table."""
-        line_count = 0
         system = network.system if hasattr(network, 'system') else ""
         
-        for line in network.getElements("lines"):
+        # Collect the rows of the exportable lines and create the whole line table in one call
+        lines = network.getElements("lines")
+        columns = {column: [] for column in ('from_bus', 'to_bus', 'name', 'length_km', 'r_ohm_per_km',
+                                              'x_ohm_per_km', 'c_nf_per_km', 'g_us_per_km', 'max_i_ka')}
+        for line in lines:
             if line.bus1.id not in bus_mapping or line.bus2.id not in bus_mapping:
                 logger.warning(f"Buses not found for line {line.id}: {line.bus1.id} -> {line.bus2.id}")
                 continue
             
-            from_bus = bus_mapping[line.bus1.id]
-            to_bus = bus_mapping[line.bus2.id]
+            columns['from_bus'].append(bus_mapping[line.bus1.id])
+            columns['to_bus'].append(bus_mapping[line.bus2.id])
+            columns['name'].append((system + "_" if system else "") + line.getId(line.id))
             
             # Get line parameters for pandapower
-            line_params = self._calculate_line_parameters(line)
-            
-            pp.create_line_from_parameters(
+            for column, value in self._calculate_line_parameters(line).items():
+                columns[column].append(value)
+            logger.debug(f"Created line {columns['name'][-1]} from bus {columns['from_bus'][-1]} to bus {columns['to_bus'][-1]}")
+        
+        line_count = len(columns['name'])
+        if line_count:
+            pp.create_lines_from_parameters(
                 pp_net,
-                from_bus=from_bus,
-                to_bus=to_bus,
-                length_km=line_params['length_km'],
-                name=(system + "_" if system else "") + line.getId(line.id),
-                r_ohm_per_km=line_params['r_ohm_per_km'],
-                x_ohm_per_km=line_params['x_ohm_per_km'],
-                c_nf_per_km=line_params['c_nf_per_km'],
-                g_us_per_km=line_params['g_us_per_km'],
-                max_i_ka=line_params['max_i_ka'],
+                from_buses=columns['from_bus'],
+                to_buses=columns['to_bus'],
+                length_km=columns['length_km'],
+                name=columns['name'],
+                r_ohm_per_km=columns['r_ohm_per_km'],
+                x_ohm_per_km=columns['x_ohm_per_km'],
+                c_nf_per_km=columns['c_nf_per_km'],
+                g_us_per_km=columns['g_us_per_km'],
+                max_i_ka=columns['max_i_ka'],
                 in_service=True
             )
-            line_count += 1
-            logger.debug(f"Created line {system + '_' if system else ''}{line.getId(line.id)} from bus {from_bus} to bus {to_bus}")
         
         logger.info(f"Exported {line_count} lines")
 
@@ -463,6 +446,7 @@ class PandapowerExporter(Exporter):
         """Export switches from topology Network to pandapower switch table."""
         switch_count = 0
         system = network.system if hasattr(network, 'system') else ""
+        closed_by_open_state = self._closed_by_open_state
         
         for switch in network.getElements("switches"):
             if switch.bus1.id not in bus_mapping or switch.bus2.id not in bus_mapping:
@@ -473,7 +457,7 @@ class PandapowerExporter(Exporter):
             element_idx = bus_mapping[switch.bus2.id]
             
             # Determine switch state
-            closed = not (switch.open == 'True' or switch.open == True)
+            closed = closed_by_open_state.get(switch.open, True)
             
             pp.create_switch(
                 pp_net,
@@ -1,9 +1,10 @@
 import logging as logging
 import pandapower as pp
 import pandas as pd
+from collections import defaultdict
 from typing import Dict, Set, List, Tuple
 from base_importer import Importer
-from topology import Network, Substation, VoltageLevel, Bus, Load, Generator, Line, Switch, TwoWindingsTransformer
+from topology import Network, Substation, VoltageLevel, Bus, Load, Generator, MvGenerator, Line, Switch, TwoWindingsTransformer
 
 class PandapowerImporter(Importer):
 
@@ -109,12 +110,13 @@ class PandapowerImporter(Importer):
         """Infer substations from transformer connections and voltage grouping."""
         # Group buses by transformers - each transformer defines a substation
         if 'trafo' in pp_net and not pp_net.trafo.empty:
-            for idx, trafo in pp_net.trafo.iterrows():
-                if not trafo.get('in_service', True):
+            for trafo in pp_net.trafo.itertuples():
+                idx = trafo.Index
+                if not getattr(trafo, 'in_service', True):
                     continue
                     
-                hv_bus = int(trafo['hv_bus'])
-                lv_bus = int(trafo['lv_bus'])
+                hv_bus = int(trafo.hv_bus)
+                lv_bus = int(trafo.lv_bus)
                 
                 # Create substation ID based on transformer
                 sub_id = f"SUB_T{idx}_{hv_bus}_{lv_bus}"
@@ -139,13 +141,14 @@ class PandapowerImporter(Importer):
             logger.warning("No buses found in pandapower network")
             return
             
-        for idx, bus_data in pp_net.bus.iterrows():
-            if not bus_data.get('in_service', True):
+        for bus_data in pp_net.bus.itertuples():
+            idx = bus_data.Index
+            if not getattr(bus_data, 'in_service', True):
                 continue
                 
             bus_id = str(idx)
-            bus_name = bus_data.get('name', f"Bus {idx}")
-            vn_kv = bus_data['vn_kv']
+            bus_name = getattr(bus_data, 'name', f"Bus {idx}")
+            vn_kv = bus_data.vn_kv
             
             # Get voltage level
             voltage_level = voltage_levels.get(vn_kv)
@@ -174,115 +177,129 @@ class PandapowerImporter(Importer):
             return
             
         load_count = 0
-        for idx, load_data in pp_net.load.iterrows():
-            if not load_data.get('in_service', True):
+        # Loads are built per row and attached to their buses in one batch per bus
+        loads_by_bus: Dict[Bus, List[Load]] = defaultdict(list)
+        for load_data in pp_net.load.itertuples():
+            idx = load_data.Index
+            if not getattr(load_data, 'in_service', True):
                 continue
                 
-            bus_idx = int(load_data['bus'])
+            bus_idx = int(load_data.bus)
             if bus_idx not in buses_dict:
                 logger.warning(f"Bus {bus_idx} not found for load {idx}")
                 continue
                 
             bus = buses_dict[bus_idx]
             load_id = str(idx)
-            load_name = load_data.get('name', f"Load {idx}")
-            p_mw = load_data.get('p_mw', 0.0)
-            q_mvar = load_data.get('q_mvar', 0.0)
-            load_type = load_data.get('type', 'wye')
+            load_name = getattr(load_data, 'name', f"Load {idx}")
+            p_mw = getattr(load_data, 'p_mw', 0.0)
+            q_mvar = getattr(load_data, 'q_mvar', 0.0)
+            load_type = getattr(load_data, 'type', 'wye')
             
-            bus.addLoad(load_id, load_name, p=p_mw, q=q_mvar, type=load_type)
+            loads_by_bus[bus].append(Load(load_id, load_name, bus, p=p_mw, q=q_mvar, type=load_type))
             load_count += 1
+
+        for bus, loads in loads_by_bus.items():
+            bus.addElements("loads", loads)
             
         logger.info(f"Created {load_count} loads")
     
     def _create_generators(self, pp_net, buses_dict: Dict[int, Bus], logger):
         """Create Generator objects from pandapower generators (gen, sgen, ext_grid)."""
         gen_count = 0
+        # Generators of the three tables are attached to their buses in one batch per bus
+        generators_by_bus: Dict[Bus, List[MvGenerator]] = defaultdict(list)
         
         # Create standard generators
-        gen_count += self._create_standard_generators(pp_net, buses_dict, logger)
+        gen_count += self._create_standard_generators(pp_net, buses_dict, generators_by_bus, logger)
         
         # Create static generators (renewable, etc.)
-        gen_count += self._create_static_generators(pp_net, buses_dict, logger)
+        gen_count += self._create_static_generators(pp_net, buses_dict, generators_by_bus, logger)
         
         # Create external grids (slack buses)
-        gen_count += self._create_external_grids(pp_net, buses_dict, logger)
+        gen_count += self._create_external_grids(pp_net, buses_dict, generators_by_bus, logger)
+
+        for bus, generators in generators_by_bus.items():
+            bus.addElements("generators", generators)
                 
         logger.info(f"Created {gen_count} generators")
     
-    def _create_standard_generators(self, pp_net, buses_dict: Dict[int, Bus], logger):
+    def _create_standard_generators(self, pp_net, buses_dict: Dict[int, Bus], generators_by_bus: Dict[Bus, List[MvGenerator]], logger):
         """Create standard generators from 'gen' table."""
         gen_count = 0
         if 'gen' in pp_net and not pp_net.gen.empty:
-            for idx, gen_data in pp_net.gen.iterrows():
-                if not gen_data.get('in_service', True):
+            for gen_data in pp_net.gen.itertuples():
+                idx = gen_data.Index
+                if not getattr(gen_data, 'in_service', True):
                     continue
                     
-                bus_idx = int(gen_data['bus'])
+                bus_idx = int(gen_data.bus)
                 if bus_idx not in buses_dict:
                     logger.warning(f"Bus {bus_idx} not found for generator {idx}")
                     continue
                     
                 bus = buses_dict[bus_idx]
                 gen_id = f"GEN_{idx}"
-                gen_name = gen_data.get('name', f"Generator {idx}")
+                gen_name = getattr(gen_data, 'name', f"Generator {idx}")
                 
-                p_mw = gen_data.get('p_mw', 0.0)
-                vm_pu = gen_data.get('vm_pu', 1.0)
-                min_p_mw = gen_data.get('min_p_mw', 0.0)
-                max_p_mw = gen_data.get('max_p_mw', p_mw)
+                p_mw = getattr(gen_data, 'p_mw', 0.0)
+                vm_pu = getattr(gen_data, 'vm_pu', 1.0)
+                min_p_mw = getattr(gen_data, 'min_p_mw', 0.0)
+                max_p_mw = getattr(gen_data, 'max_p_mw', p_mw)
                 
-                bus.addMvGenerator(gen_id, gen_name, minP=min_p_mw, maxP=max_p_mw, 
-                                 targetP=p_mw, targetV=vm_pu, controllable=True)
+                generators_by_bus[bus].append(MvGenerator(gen_id, gen_name, bus, minP=min_p_mw, maxP=max_p_mw,
+                                                          targetP=p_mw, targetV=vm_pu, controllable=True))
                 gen_count += 1
         return gen_count
     
-    def _create_static_generators(self, pp_net, buses_dict: Dict[int, Bus], logger):
+    def _create_static_generators(self, pp_net, buses_dict: Dict[int, Bus], generators_by_bus: Dict[Bus, List[MvGenerator]], logger):
         """Create static generators from 'sgen' table."""
         gen_count = 0
         if 'sgen' in pp_net and not pp_net.sgen.empty:
-            for idx, sgen_data in pp_net.sgen.iterrows():
-                if not sgen_data.get('in_service', True):
+            for sgen_data in pp_net.sgen.itertuples():
+                idx = sgen_data.Index
+                if not getattr(sgen_data, 'in_service', True):
                     continue
                     
-                bus_idx = int(sgen_data['bus'])
+                bus_idx = int(sgen_data.bus)
                 if bus_idx not in buses_dict:
                     logger.warning(f"Bus {bus_idx} not found for static generator {idx}")
                     continue
                     
                 bus = buses_dict[bus_idx]
                 sgen_id = f"SGEN_{idx}"
-                sgen_name = sgen_data.get('name', f"Static Generator {idx}")
+                sgen_name = getattr(sgen_data, 'name', f"Static Generator {idx}")
                 
-                p_mw = sgen_data.get('p_mw', 0.0)
-                q_mvar = sgen_data.get('q_mvar', 0.0)
+                p_mw = getattr(sgen_data, 'p_mw', 0.0)
+                q_mvar = getattr(sgen_data, 'q_mvar', 0.0)
                 
-                bus.addMvGenerator(sgen_id, sgen_name, targetP=p_mw, targetQ=q_mvar,
-                                 controllable=False, coords=None)
+                generators_by_bus[bus].append(MvGenerator(sgen_id, sgen_name, bus, targetP=p_mw, targetQ=q_mvar,
+                                                          controllable=False, coords=None))
                 gen_count += 1
         return gen_count
     
-    def _create_external_grids(self, pp_net, buses_dict: Dict[int, Bus], logger):
+    def _create_external_grids(self, pp_net, buses_dict: Dict[int, Bus], generators_by_bus: Dict[Bus, List[MvGenerator]], logger):
         """Create external grids from 'ext_grid' table.""" 
         gen_count = 0
         if 'ext_grid' in pp_net and not pp_net.ext_grid.empty:
-            for idx, ext_grid_data in pp_net.ext_grid.iterrows():
-                if not ext_grid_data.get('in_service', True):
+            for ext_grid_data in pp_net.ext_grid.itertuples():
+                idx = ext_grid_data.Index
+                if not getattr(ext_grid_data, 'in_service', True):
                     continue
                     
-                bus_idx = int(ext_grid_data['bus'])
+                bus_idx = int(ext_grid_data.bus)
                 if bus_idx not in buses_dict:
                     logger.warning(f"Bus {bus_idx} not found for external grid {idx}")
                     continue
                     
                 bus = buses_dict[bus_idx]
                 ext_grid_id = f"EXT_GRID_{idx}"
-                ext_grid_name = ext_grid_data.get('name', f"External Grid {idx}")
+                ext_grid_name = getattr(ext_grid_data, 'name', f"External Grid {idx}")
                 
-                vm_pu = ext_grid_data.get('vm_pu', 1.0)
+                vm_pu = getattr(ext_grid_data, 'vm_pu', 1.0)
                 
-                bus.addMvGenerator(ext_grid_id, ext_grid_name, targetV=vm_pu,
-                                 controllable=True, coords=None)
+                generators_by_bus[bus].append(MvGenerator(ext_grid_id, ext_grid_name, bus, targetV=vm_pu,
+                                                          controllable=True, coords=None))
                 gen_count += 1
         return gen_count
     
@@ -293,12 +310,13 @@ class PandapowerImporter(Importer):
             return
             
         line_count = 0
-        for idx, line_data in pp_net.line.iterrows():
-            if not line_data.get('in_service', True):
+        for line_data in pp_net.line.itertuples():
+            idx = line_data.Index
+            if not getattr(line_data, 'in_service', True):
                 continue
                 
-            from_bus_idx = int(line_data['from_bus'])
-            to_bus_idx = int(line_data['to_bus'])
+            from_bus_idx = int(line_data.from_bus)
+            to_bus_idx = int(line_data.to_bus)
             
             if from_bus_idx not in buses_dict or to_bus_idx not in buses_dict:
                 logger.warning(f"Buses not found for line {idx}: {from_bus_idx} -> {to_bus_idx}")
@@ -308,15 +326,15 @@ class PandapowerImporter(Importer):
             to_bus = buses_dict[to_bus_idx]
             
             line_id = str(idx)
-            line_name = line_data.get('name', f"Line {idx}")
+            line_name = getattr(line_data, 'name', f"Line {idx}")
             
             # Line parameters
-            length_km = line_data.get('length_km', 0.0)
-            r_ohm_per_km = line_data.get('r_ohm_per_km', 0.0)
-            x_ohm_per_km = line_data.get('x_ohm_per_km', 0.0)
-            c_nf_per_km = line_data.get('c_nf_per_km', 0.0)
-            g_us_per_km = line_data.get('g_us_per_km', 0.0)
-            max_i_ka = line_data.get('max_i_ka', 0.0)
+            length_km = getattr(line_data, 'length_km', 0.0)
+            r_ohm_per_km = getattr(line_data, 'r_ohm_per_km', 0.0)
+            x_ohm_per_km = getattr(line_data, 'x_ohm_per_km', 0.0)
+            c_nf_per_km = getattr(line_data, 'c_nf_per_km', 0.0)
+            g_us_per_km = getattr(line_data, 'g_us_per_km', 0.0)
+            max_i_ka = getattr(line_data, 'max_i_ka', 0.0)
             
             # Calculate total impedances
             r_total = r_ohm_per_km * length_km / 1000  # Convert to per unit or appropriate scale
@@ -339,8 +357,9 @@ class PandapowerImporter(Importer):
             return
             
         trafo_count = 0
-        for idx, trafo_data in pp_net.trafo.iterrows():
-            if not trafo_data.get('in_service', True):
+        for trafo_data in pp_net.trafo.itertuples():
+            idx = trafo_data.Index
+            if not getattr(trafo_data, 'in_service', True):
                 continue
                 
             transformer = self._create_single_transformer(idx, trafo_data, substations, buses_dict, logger)
@@ -352,8 +371,8 @@ class PandapowerImporter(Importer):
     def _create_single_transformer(self, idx, trafo_data, substations: Dict[str, Substation], 
                                    buses_dict: Dict[int, Bus], logger):
         """Create a single transformer from pandapower data."""
-        hv_bus_idx = int(trafo_data['hv_bus'])
-        lv_bus_idx = int(trafo_data['lv_bus'])
+        hv_bus_idx = int(trafo_data.hv_bus)
+        lv_bus_idx = int(trafo_data.lv_bus)
         
         if hv_bus_idx not in buses_dict or lv_bus_idx not in buses_dict:
             logger.warning(f"Buses not found for transformer {idx}: {hv_bus_idx} -> {lv_bus_idx}")
@@ -366,7 +385,7 @@ class PandapowerImporter(Importer):
         substation = self._get_or_create_substation(idx, hv_bus_idx, lv_bus_idx, substations, hv_bus)
         
         trafo_id = str(idx)
-        trafo_name = trafo_data.get('name', f"Transformer {idx}")
+        trafo_name = getattr(trafo_data, 'name', f"Transformer {idx}")
         
         # Calculate transformer impedances
         impedances = self._calculate_transformer_impedances(trafo_data)
@@ -382,7 +401,7 @@ class PandapowerImporter(Importer):
         # Create a new substation for this transformer
         sub_name = f"Substation T{idx}"
         if substations:
-            parent_network = list(substations.values())[0].parent
+            parent_network = next(iter(substations.values())).parent
         else:
             parent_network = hv_bus.parent
         substation = parent_network.addSubstation(sub_id, sub_name)
@@ -391,11 +410,11 @@ class PandapowerImporter(Importer):
     
     def _calculate_transformer_impedances(self, trafo_data):
         """Calculate transformer impedances from pandapower parameters."""
-        sn_mva = trafo_data.get('sn_mva', 1.0)
-        vk_percent = trafo_data.get('vk_percent', 0.0)
-        vkr_percent = trafo_data.get('vkr_percent', 0.0)
-        pfe_kw = trafo_data.get('pfe_kw', 0.0)
-        i0_percent = trafo_data.get('i0_percent', 0.0)
+        sn_mva = getattr(trafo_data, 'sn_mva', 1.0)
+        vk_percent = getattr(trafo_data, 'vk_percent', 0.0)
+        vkr_percent = getattr(trafo_data, 'vkr_percent', 0.0)
+        pfe_kw = getattr(trafo_data, 'pfe_kw', 0.0)
+        i0_percent = getattr(trafo_data, 'i0_percent', 0.0)
         
         # Calculate transformer impedances (simplified)
         r = vkr_percent / 100.0
@@ -412,12 +431,13 @@ class PandapowerImporter(Importer):
             return
             
         switch_count = 0
-        for idx, switch_data in pp_net.switch.iterrows():
-            if switch_data.get('et') != 'b':  # Only bus-to-bus switches
+        for switch_data in pp_net.switch.itertuples():
+            idx = switch_data.Index
+            if getattr(switch_data, 'et', None) != 'b':  # Only bus-to-bus switches
                 continue
                 
-            bus_idx = int(switch_data['bus'])
-            element_idx = int(switch_data['element'])
+            bus_idx = int(switch_data.bus)
+            element_idx = int(switch_data.element)
             
             if bus_idx not in buses_dict or element_idx not in buses_dict:
                 logger.warning(f"Buses not found for switch {idx}: {bus_idx} -> {element_idx}")
@@ -427,8 +447,8 @@ class PandapowerImporter(Importer):
             bus2 = buses_dict[element_idx]
             
             switch_id = str(idx)
-            switch_name = switch_data.get('name', f"Switch {idx}")
-            closed = switch_data.get('closed', True)
+            switch_name = getattr(switch_data, 'name', f"Switch {idx}")
+            closed = getattr(switch_data, 'closed', True)
             
             topology.addSwitch(switch_id, switch_name, bus1, bus2, 
                              open=not closed, retained=False)
@@ -33,39 +33,53 @@ Classes:
     Meter: Measurement device
 """
 
-from ast import Dict
-import json
-from re import sub
-from sys import prefix
+import sys
 from Utils import Transliterate,Sanitizer
 
 
 class Identifiable:
+    __slots__ = ("id", "name", "parent", "prefix")
+
+    # One Sanitizer per prefix, shared by getId across all elements
+    sanitizers = {}
+
     def __init__(self, id, name, parent = None, prefix=None):
-        self.id = str(id)
+        # Interned: the same ids are stored in every elementsById/registry index and compared on each lookup
+        self.id = sys.intern(str(id))
         # self.name = Transliterate.process(str(name)) if name is not None else ''
         self.name = str(name) if name is not None else ''
         self.parent = parent
-        self.prefix=prefix
-        self.prefix = self.getPrefix()
+        # Resolved once: an explicit prefix, else the (already resolved) prefix of the parent
+        self.prefix = prefix if prefix is not None else ("" if parent is None else parent.prefix)
 
     def getPrefix(self, ):
-        return self.prefix if self.prefix!=None else ("" if self.parent==None else self.parent.getPrefix()) 
+        return self.prefix
         
     def getId(self,id):
-        sanitizer = Sanitizer(system="", prefix=self.prefix)
+        sanitizer = Identifiable.sanitizers.get(self.prefix)
+        if sanitizer is None:
+            sanitizer = Identifiable.sanitizers[self.prefix] = Sanitizer(system="", prefix=self.prefix)
         return sanitizer.sanitizeId(id)
         #return (self.prefix + "_" if not self.prefix=="" and not id.startswith(self.prefix) else "") + str(Transliterate.process(id))        
         
+# Location and LineShape are mixed into Container/Element subclasses, so they declare no slots
+# of their own (two slotted bases would conflict); every subclass lists "coords"/"line_shape"
 class Location():
-    def __init__(self,coords=[]):
-        self.coords = coords
+    __slots__ = ()
+
+    def __init__(self,coords=None):
+        # Shared empty tuple when there are no coordinates, instead of a list per element
+        self.coords = coords if coords is not None else ()
 
 class LineShape():
-    def __init__(self,line_shape=[]):
-        self.line_shape = line_shape
+    __slots__ = ()
+
+    def __init__(self,line_shape=None):
+        self.line_shape = line_shape if line_shape is not None else ()
         
 class Element(Identifiable):
+    __slots__ = ("location", "measurements")
+
     def __init__(self, id, name , parent = None,prefix=None, location:Location=None):
         Identifiable.__init__(self,id, name=name, prefix=prefix, parent=parent)
         self.location = location
@@ -76,36 +90,52 @@ class Element(Identifiable):
         
 
 class Container(Element):
-    def __init__(self, id, name , parent = None,prefix=None, location:Location=None, containerElements=[]):
+    __slots__ = ("elements", "elementsById")
+
+    def __init__(self, id, name , parent = None,prefix=None, location:Location=None):
         Element.__init__(self, id, name=name, parent = parent,prefix=prefix, location=location )
-        self.elements = {e:[] for e in containerElements}
+        # type -> elements; the list (and index) of a type is created by its first addElement
+        self.elements = {}
+        # id -> element per type, backing getElement; the first element added with an id wins, as in a list scan
+        self.elementsById = {}
                 
     def addElement(self, type, element):
-        if type in self.elements:
-            self.elements[type].append(element)
-        else:
+        elements = self.elements.get(type)
+        if elements is None:
             self.elements[type] = [element]
+            self.elementsById[type] = {element.id: element}
+        else:
+            elements.append(element)
+            self.elementsById[type].setdefault(element.id, element)
         return element
 
+    # Bulk version of addElement: appends a batch of already built elements with a single extend
+    def addElements(self, type, elements):
+        if type in self.elements:
+            self.elements[type].extend(elements)
+        else:
+            self.elements[type] = list(elements)
+        index = self.elementsById.setdefault(type, {})
+        for element in elements:
+            index.setdefault(element.id, element)
+        return elements
+
     def getElements(self, type):
         # if not type in self.elements:
         #     print("ERROR:" + type + " not found in " + self.id)
-        return self.elements[type] if type in self.elements else []
+        elements = self.elements.get(type)
+        return elements if elements is not None else []
         
     def getElement(self, type, id):
-        id=str(id)
-        
-        # if not type in self.elements:
-        #     print("ERROR:" + type + " not found in " + self.id)
-        for element in self.getElements(type):
-            if element.id == id:
-                return element
-        return None 
+        index = self.elementsById.get(type)
+        return index.get(str(id)) if index is not None else None
 
 class  VoltageLevel(Container):
+    __slots__ = ("nominalV", "type")
+
     def __init__(self, id, name , nominalV=None, type='MV',network:Element=None):
         Element.__init__(self,id, name , parent=network)
-        Container.__init__(self,id, name , parent=network, containerElements= ["buses", "switches", "lines"])
+        Container.__init__(self,id, name , parent=network)
         self.nominalV = nominalV        
         self.type=type
         # self.feeder=feeder
@@ -140,11 +170,27 @@ class  VoltageLevel(Container):
     #     return line
 
 class Network(Container):
+    __slots__ = ("network", "system", "type", "registry", "standaloneRegistry")
+
     def __init__(self,id,name , parent=None, prefix=None, network=None, system=None):         
-        Container.__init__(self,id,name, parent=parent, prefix=prefix, containerElements=["buses","lines","switches","substations","voltageLevels","subTopologies"])
+        Container.__init__(self,id,name, parent=parent, prefix=prefix)
         self.network = network if network else id
         self.system = system
         self.type = 'MV' if parent is None else 'LV'
+        # Network-wide id -> element lookups, filled as buses and bus elements are added anywhere below this network.
+        # Substation buses (and their elements) and standalone ones are kept apart so that, as with the former
+        # substation-then-standalone scans, a substation one wins over a standalone one with the same id
+        self.registry = {"buses": {}, "substationByBus": {}, "loads": {}, "generators": {}, "usagePoints": {}, "usagePointLocations": {}}
+        self.standaloneRegistry = {type: {} for type in self.registry}
+
+    # Within each group the first registration of an id wins
+    def register(self, type, id, element, standalone=False):
+        (self.standaloneRegistry if standalone else self.registry)[type].setdefault(id, element)
+
+    def lookup(self, type, id):
+        id = str(id)
+        element = self.registry[type].get(id)
+        return element if element is not None else self.standaloneRegistry[type].get(id)
 
     def addSubTopology(self, id,name ):
         t = Network(id,name,network=id, parent=self, prefix=id, system=self.system)
@@ -154,7 +200,7 @@ class Network(Container):
     def getSubTopology(self, id):
         return self.getElement("subTopologies",id)
     
-    def addSubstation(self, id, name , coords=[]):
+    def addSubstation(self, id, name , coords=None):
         s:Substation = self.getElement("substations",id)
         if s== None:
             s = Substation(id, name=name, coords= coords, parent=self)
@@ -164,18 +210,20 @@ class Network(Container):
     def hasBus(self, id):
         return self.getElement("buses", id) is not None
     
-    def addBus(self, id, name, voltageLevel:VoltageLevel, coords=[],feeder_num=None):
-        return self.addElement("buses", Bus(id, name, network=self, voltageLevel=voltageLevel, coords=coords,feeder_num=feeder_num))
+    def addBus(self, id, name, voltageLevel:VoltageLevel, coords=None,feeder_num=None):
+        bus = self.addElement("buses", Bus(id, name, network=self, voltageLevel=voltageLevel, coords=coords,feeder_num=feeder_num))
+        self.register("buses", bus.id, bus, standalone=True)
+        return bus
     
     def getBus(self, id):
         return self.getElement("buses", id)
     
-    def addSwitch(self, id, name, bus1, bus2, open=False, retained=False, coords=[],feeder_num=None):
+    def addSwitch(self, id, name, bus1, bus2, open=False, retained=False, coords=None,feeder_num=None):
         s = Switch(id, name, bus1, bus2, open, retained, network=self, coords=coords, feeder_num=feeder_num)
         self.addElement("switches",s)
         return s
 
-    def addLine(self, id, name, bus1, bus2, r=0, x=0, g1=0, b1=0, g2=0, b2=0, currentLimit=0, line_shape=[],length=0,cable='',feeder_num=None):
+    def addLine(self, id, name, bus1, bus2, r=0, x=0, g1=0, b1=0, g2=0, b2=0, currentLimit=0, line_shape=None,length=0,cable='',feeder_num=None):
         if(bus1 == bus2):
             print("bucle eliminado")
             return
@@ -185,67 +233,30 @@ class Network(Container):
         return self.getElement("substations",id)
             
     def getLoad(self, id):
-        for sub in self.getElements("substations"):
-            for b in sub.getElements("buses"):
-                l = b.getElement("loads",id)
-                if l is not None:
-                    return l
-        for b in self.getElements("buses"):
-            l = b.getElement("loads",id)
-            if l is not None:
-                return l
-        return None
+        return self.lookup("loads", id)
     
     def getUsagePointLocation(self, id):
-        for sub in self.getElements("substations"):
-            for b in sub.getElements("buses"):
-                up = b.getElement("usagePointLocations",id)
-                if up is not None:
-                    return up
-        for b in self.getElements("buses"):
-            up = b.getElement("usagePointLocations",id)
-            if up is not None:
-                return up
-        return None
+        return self.lookup("usagePointLocations", id)
 
     def getUsagePoint(self, id):
-        for sub in self.getElements("substations"):
-            for b in sub.getElements("buses"):
-                up = b.getElement("usagePoints",id)
-                if up is not None:
-                    return up
-        
-        for b in self.getElements("buses"):
-            up = b.getElement("usagePoints",id)
-            if up is not None:
-                return up
-        return None
+        return self.lookup("usagePoints", id)
     
     def getGenerator(self, id):
-        for sub in self.getElements("substations"):
-            for b in sub.getElements("buses"):
-                gen = b.getElement("generators",id)
-                if gen is not None:
-                    return gen
-        for b in self.getElements("buses"):
-            gen = b.getElement("generators",id)
-            if gen is not None:
-                return gen
-        return None
+        return self.lookup("generators", id)
 
     def getSubstationFromBus(self, id):
-        for substation in self.getElements("substations"):
-            if substation.getElement("buses",id) != None:
-                return substation
-        return None
+        return self.lookup("substationByBus", id)
 
     def getBus(self, id):
+        return self.lookup("buses", id)
+
+    # Every bus of this network with its substation (None for standalone buses), substation buses first
+    def iterAllBuses(self):
         for sub in self.getElements("substations"):
-            b= sub.getElement("buses",id)
-            if b is not None:
-                return b
-        return  self.getElement("buses",id)
-        
+            for b in sub.getElements("buses"):
+                yield b, sub
+        for b in self.getElements("buses"):
+            yield b, None
     
     def getVoltageLevel(self, id):
         return  self.getElement("voltageLevels",id)            
@@ -262,8 +273,10 @@ class Network(Container):
         return self.getElement("voltageLevels",id)!=None
 
 class Substation(Container,Location):
-    def __init__(self, id, name ,parent:Network, coords=[]):
-        Container.__init__(self,id,name=name,parent=parent,containerElements= ["buses", "switches","lines","twoWindingsTransformers","threeWindingsTransformers"])
+    __slots__ = ("coords",)
+
+    def __init__(self, id, name ,parent:Network, coords=None):
+        Container.__init__(self,id,name=name,parent=parent)
         Location.__init__(self,coords=coords)
  
     def getBus(self, id):        
@@ -278,7 +291,7 @@ class Substation(Container,Location):
     
     def getUsagePointLocation(self,id):
         for bus in self.getElements("buses"):
-            up:UsagePointLocation = bus.getElement("getUsagePointLocation",id)
+            up:UsagePointLocation = bus.getElement("usagePointLocations",id)
             if up != None: 
                 return up
         return None
@@ -286,13 +299,13 @@ class Substation(Container,Location):
     def addTransformer(self, id, name, bus1:Container, bus2:Container, r=None, x=None, g=None, b=None, nominal=None,
                        i0_percent=None, pfe_kw=None, shift_degree=None, std_type=None, tap_max=None, tap_min=None,
                        tap_neutral=None, tap_pos=None, tap_side=None, tap_step_degree=None, tap_step_percent=None,
-                       vk_percent=None, vkr_percent=None, coords=[]):
+                       vk_percent=None, vkr_percent=None, coords=None):
         return self.addElement("twoWindingsTransformers",TwoWindingsTransformer(
             id, name,self, bus1, bus2, r=r, x=x, g=g, b=b, nominal=nominal, i0_percent=i0_percent, pfe_kw=pfe_kw, shift_degree=shift_degree,
             std_type=std_type, tap_max=tap_max, tap_min=tap_min, tap_neutral=tap_neutral, tap_pos=tap_pos, tap_side=tap_side,
             tap_step_degree=tap_step_degree, tap_step_percent=tap_step_percent, vk_percent=vk_percent, vkr_percent=vkr_percent, coords=coords))
 
-    def addTriTransformer(self, id, name, bus1, bus2, bus3, r1=None, x1=None, g1=None, b1=None, r2=None, x2=None, g2=None, b2=None, r3=None, x3=None, g3=None, b3=None,  ratedS1=None, ratedS2=None, ratedS3=None, ratedStar=None, coords=[]):
+    def addTriTransformer(self, id, name, bus1, bus2, bus3, r1=None, x1=None, g1=None, b1=None, r2=None, x2=None, g2=None, b2=None, r3=None, x3=None, g3=None, b3=None,  ratedS1=None, ratedS2=None, ratedS3=None, ratedStar=None, coords=None):
         return self.addElement("threeWindingsTransformers",ThreeWindingsTransformer(
             id, name,self, bus1, bus2, bus3,  r1=r1, x1=x1, g1=g1, b1=b1, r2=r2, x2=x2, g2=g2, b2=b2, r3=r3, x3=x3, g3=g3, b3=b3, ratedS1=ratedS1, ratedS2=ratedS2, ratedS3=ratedS3, ratedStar=ratedStar, coords=coords))
 
@@ -328,9 +341,11 @@ class Substation(Container,Location):
     def getBus(self, id):
         return self.getElement("buses", id)
     
-    def addBus(self, id, name, voltageLevel:VoltageLevel, coords=[], feeder_num=None):
+    def addBus(self, id, name, voltageLevel:VoltageLevel, coords=None, feeder_num=None):
         bus = Bus(id, name, voltageLevel=voltageLevel, substation=self, coords=coords, feeder_num=feeder_num)
         self.addElement("buses", bus)
+        self.parent.register("buses", bus.id, bus)
+        self.parent.register("substationByBus", bus.id, self)
         return bus
           
     # def addSwitch(self, id, bus1, bus2, open, retained=False):
@@ -338,7 +353,7 @@ class Substation(Container,Location):
     #     self.addElement("switches", s)
     #     return s
 
-    def addLine(self, id, name, bus1, bus2, r=0, x=0, g1=0, b1=0, g2=0, b2=0, currentLimit=0, lineShape=[],length=0,cable=''): 
+    def addLine(self, id, name, bus1, bus2, r=0, x=0, g1=0, b1=0, g2=0, b2=0, currentLimit=0, lineShape=None,length=0,cable=''): 
         if(bus1 == bus2):
             print("bucle eliminado")
             return
@@ -348,32 +363,46 @@ class Substation(Container,Location):
         return line
 
 class Bus(Container, Location):
-    def __init__(self, id, name ,  voltageLevel:VoltageLevel=None, substation:Substation= None, network:Network=None, coords=[], feeder_num=None):
-        Container.__init__(self,id, name , parent=substation if substation!=None else network, prefix=voltageLevel.prefix, containerElements=["usagePoints","usagePointLocations","loads","generators","danglingLines","shuntCompensators"])
+    __slots__ = ("coords", "voltageLevel", "feeder_num", "ownerRegistry")
+
+    def __init__(self, id, name ,  voltageLevel:VoltageLevel=None, substation:Substation= None, network:Network=None, coords=None, feeder_num=None):
+        Container.__init__(self,id, name , parent=substation if substation!=None else network, prefix=voltageLevel.prefix)
         Location.__init__(self,coords=coords)
         self.voltageLevel = voltageLevel
         self.feeder_num = feeder_num
+        # Registry of the network owning this bus, where its loads, generators and usage points are registered
+        if substation!=None:
+            self.ownerRegistry = substation.parent.registry
+        else:
+            self.ownerRegistry = network.standaloneRegistry if network is not None else None
         if not self.voltageLevel.hasBus(id):
             self.voltageLevel.addElement("buses",self)
+
+    def addElement(self, type, element):
+        Container.addElement(self, type, element)
+        registry = self.ownerRegistry
+        if registry is not None and type in registry:
+            registry[type].setdefault(element.id, element)
+        return element
+
+    def addElements(self, type, elements):
+        Container.addElements(self, type, elements)
+        registry = self.ownerRegistry
+        if registry is not None and type in registry:
+            index = registry[type]
+            for element in elements:
+                index.setdefault(element.id, element)
+        return elements
         
     
     def getLoad(self, id):
-        for load in self.loads:
-            if load.id==id: 
-                return load
-        return None
+        return self.getElement("loads", id)
     
     def getUsagePointLocation(self, id):
-        for up in self.usagePointLocations:
-            if up.id==id: 
-                return up
-        return None
+        return self.getElement("usagePointLocations", id)
     
     def getGenerator(self,id):
-        for generator in self.generators:
-            if generator.id==id: 
-                return generator
-        return None
+        return self.getElement("generators", id)
     
     def addLoad(self, id, name,  p=None, q=None, type=None, coords=None):
         return self.addElement("loads", Load(id, name, self, p=p, q=q,  type=type, coords=coords))
@@ -402,8 +431,10 @@ class Bus(Container, Location):
             id, id,maxSecCount, bPerSection, gPerSection, bus,self.prefix))
         
 class UsagePoint(Container):
+    __slots__ = ("ratedPower", "feeder_num")
+
     def __init__(self, id, name , bus:Bus,usagePointLocation:Location=None,ratedPower=None, feeder_num=None):
-        Container.__init__(self,id, name , parent=bus, location=usagePointLocation,containerElements= ["meters"])
+        Container.__init__(self,id, name , parent=bus, location=usagePointLocation)
         self.ratedPower = ratedPower
         self.feeder_num = feeder_num
         
@@ -413,8 +444,10 @@ class UsagePoint(Container):
         return m 
 
 class UsagePointLocation(Container, Location):
+    __slots__ = ("coords", "type", "feeder_num")
+
     def __init__(self, id, name , bus:Bus, type='MV', coords=None, feeder_num=None):
-        Container.__init__(self,id, name , parent=bus, containerElements=["usagePoints", "generators"])        
+        Container.__init__(self,id, name , parent=bus)        
         Location.__init__(self,coords)
         self.type=type
         self.feeder_num = feeder_num
@@ -424,8 +457,10 @@ class UsagePointLocation(Container, Location):
         return usagePoint
 
 class Generator(Container, Location):
+    __slots__ = ("coords", "minP", "maxP", "targetP", "targetV", "targetQ", "minQ", "maxQ", "controllable", "type", "feeder_num")
+
     def __init__(self, id, name , bus:Bus, usagePointLocation:Location=None, minP=None, maxP=None, targetP=None, targetV=None, targetQ=None, minQ=None, maxQ=None,controllable=None, type="MV", coords=None, feeder_num=None):
-        Container.__init__(self,id, name , parent=bus, location=usagePointLocation, containerElements=["meters"])
+        Container.__init__(self,id, name , parent=bus, location=usagePointLocation)
         Location.__init__(self,coords)
         self.minP = minP
         self.maxP = maxP
@@ -444,6 +479,8 @@ class Generator(Container, Location):
         return m 
 
 class DanglingLine(Element):
+    __slots__ = ("p", "q", "type", "controllable", "feeder_num")
+
     #def __init__(self, id, p, q, bus,type="MV", controllable = False, network=None, remoteNetwork=None):
     def __init__(self, id, name ,bus:Bus, p=None, q=None,type="MV", controllable = False, feeder_num=None):
         Element.__init__(self,id, name ,parent=bus)
@@ -454,8 +491,10 @@ class DanglingLine(Element):
         self.feeder_num=feeder_num
 
 class Load(Container, Location):
+    __slots__ = ("coords", "p", "q", "type")
+
     def __init__(self, id,name, bus:Bus, p=None, q=None, type='MV', coords=None):
-        Container.__init__(self,id, name , parent=bus,  containerElements=["meters"] )
+        Container.__init__(self,id, name , parent=bus)
         Location.__init__(self,coords)
         self.p = p if p is not None else 0
         self.q = q if q is not None else 0
@@ -469,8 +508,10 @@ class Load(Container, Location):
         # self.meters.append(Meter(id, name, p, q, parent=self))
 
 class MvGenerator(Container, Location):
+    __slots__ = ("coords", "minP", "maxP", "targetP", "targetV", "targetQ", "minQ", "maxQ", "controllable", "type")
+
     def __init__(self, id,name, bus:Bus, minP=None, maxP=None, targetP=None, targetV=None, targetQ=None, minQ=None, maxQ=None, controllable=True, coords=None):
-        Container.__init__(self, id, name, parent=bus, containerElements=["meters"] )
+        Container.__init__(self, id, name, parent=bus)
         Location.__init__(self, coords)
         self.minP = minP
         self.maxP = maxP
@@ -490,16 +531,18 @@ class MvGenerator(Container, Location):
         # self.meters.append(Meter(id, name, p, q, parent=self))
 
 class Line(Element, LineShape):
-    def __init__(self, id, name , bus1:Bus, bus2:Bus, r, x, g1, b1, g2, b2, currentLimit,type='MV',length=0, cable='', prefix=None,line_shape=[], substation:Substation=None, network:Network=None, feeder_num=None):
+    __slots__ = ("line_shape", "bus1", "bus2", "voltageLevel", "r", "x", "g1", "b1", "g2", "b2", "currentLimit", "type", "length", "cable", "feeder_num")
+
+    def __init__(self, id, name , bus1:Bus, bus2:Bus, r, x, g1, b1, g2, b2, currentLimit,type='MV',length=0, cable='', prefix=None,line_shape=None, substation:Substation=None, network:Network=None, feeder_num=None):
         Element.__init__(self,id, name ,prefix=prefix, parent=substation if substation!=None else network)
         LineShape.__init__(self,line_shape=line_shape)
-        self.line_shape=line_shape
-        if bus1.voltageLevel != bus2.voltageLevel:
+        voltageLevel = bus1.voltageLevel
+        if voltageLevel != bus2.voltageLevel:
             print("ERROR: Voltage levels of buses " + bus1.id + " and " + bus2.id + " are different")      
         
         self.bus1 = bus1
         self.bus2 = bus2
-        self.voltageLevel = self.bus1.voltageLevel
+        self.voltageLevel = voltageLevel
         self.r = r if r is not None else 0
         self.x = x if x is not None else 0
         self.g1 = g1 if g1 is not None else 0
@@ -507,16 +550,18 @@ class Line(Element, LineShape):
         self.g2 = g2 if g2 is not None else 0
         self.b2 = b2 if b2 is not None else 0
         self.currentLimit = currentLimit
-        self.type=self.voltageLevel.type
+        self.type=voltageLevel.type
         self.length=length
         self.cable=cable
         self.feeder_num = feeder_num
 
 class TwoWindingsTransformer(Element, Location):
+    __slots__ = ("coords", "r", "x", "g", "b", "bus1", "bus2", "nominal", "i0_percent", "pfe_kw", "shift_degree", "std_type", "tap_max", "tap_min", "tap_neutral", "tap_pos", "tap_side", "tap_step_degree", "tap_step_percent", "vk_percent", "vkr_percent")
+
     def __init__(self, id, name , substation:Substation, bus1, bus2,  r=None, x=None, g=None, b=None, nominal=None,
                  i0_percent=None, pfe_kw=None, shift_degree=None, std_type=None, tap_max=None, tap_min=None,
                  tap_neutral=None, tap_pos=None, tap_side=None, tap_step_degree=None, tap_step_percent=None,
-                 vk_percent=None, vkr_percent=None, coords=[]):
+                 vk_percent=None, vkr_percent=None, coords=None):
         Element.__init__(self,id, name ,parent=substation)
         Location.__init__(self, coords)
         self.r = r if r is not None else 0
@@ -541,7 +586,9 @@ class TwoWindingsTransformer(Element, Location):
         self.vkr_percent = vkr_percent
 
 class ThreeWindingsTransformer(Element, Location):
-    def __init__(self, id, name ,substation:Substation,  bus1, bus2, bus3, ratedStar=None, r1=None, x1=None, g1=None, b1=None, r2=None, x2=None, g2=None, b2=None, r3=None, x3=None, g3=None, b3=None, ratedS1=None, ratedS2=None, ratedS3=None, coords=[]):
+    __slots__ = ("coords", "ratedStar", "ratedS1", "ratedS2", "ratedS3", "r1", "r2", "r3", "x1", "x2", "x3", "g1", "g2", "g3", "b1", "b2", "b3", "bus1", "bus2", "bus3")
+
+    def __init__(self, id, name ,substation:Substation,  bus1, bus2, bus3, ratedStar=None, r1=None, x1=None, g1=None, b1=None, r2=None, x2=None, g2=None, b2=None, r3=None, x3=None, g3=None, b3=None, ratedS1=None, ratedS2=None, ratedS3=None, coords=None):
         Element.__init__(self,id, name, substation)
         Location.__init__(self, coords)
         self.ratedStar = ratedStar
@@ -569,17 +616,20 @@ class ThreeWindingsTransformer(Element, Location):
         self.bus3 = bus3
 
 class Switch(Element, Location):
-    def __init__(self, id, name, bus1, bus2, open=False, retained=False, substation:Substation=None, network:Network=None, coords=[], feeder_num=None):
+    __slots__ = ("coords", "voltageLevel", "bus1", "bus2", "open", "retained", "feeder_num")
+
+    def __init__(self, id, name, bus1, bus2, open=False, retained=False, substation:Substation=None, network:Network=None, coords=None, feeder_num=None):
         Element.__init__(self, id, name, substation if substation is not None else network)
         Location.__init__(self, coords)
         if open=="OPEN" or open:
             open=1
         if open=="CLOSED":
             open=0
-        if bus1.voltageLevel != bus2.voltageLevel:
+        voltageLevel = bus1.voltageLevel
+        if voltageLevel != bus2.voltageLevel:
             print("ERROR: Voltage levels of buses " + bus1.id + " and " + bus2.id + " are different")
             
-        self.voltageLevel = bus1.voltageLevel
+        self.voltageLevel = voltageLevel
         self.bus1 = bus1
         self.bus2 = bus2
         self.open = str(int(open) == 1)
@@ -587,6 +637,8 @@ class Switch(Element, Location):
         self.feeder_num = feeder_num
 
 class ShuntCompensator(Element):
+    __slots__ = ("maxSecCount", "bPerSection", "gPerSection")
+
     def __init__(self, id, name , maxSecCount, bPerSection, gPerSection, bus:Bus, prefix=None):
         super().__init__(self,id, name ,prefix, parent=bus)
         self.maxSecCount = maxSecCount
@@ -594,6 +646,8 @@ class ShuntCompensator(Element):
         self.gPerSection = gPerSection
         
 class Meter(Element):
+    __slots__ = ("p", "q", "feeder_num")
+
     def __init__(self, id, name , p, q, parent, feeder_num=None):
         Element.__init__(self, id, name, parent=parent)
         self.p = p